@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Formatting of EDTF values from asyncio code.
+
+Formatting is pure CPU work, which blocks the event loop while it runs. Large
+batches are thus formatted in chunks in an executor, and the event loop keeps
+running other tasks in the meantime.
+"""
+
+import asyncio
+
+from babel.dates import LC_TIME
+
+from .formatting import _get_locale, format_edtf, format_edtf_many
+
+
+async def aformat_edtf(edtf_level0=None, format="medium", locale=LC_TIME):
+    """Format a EDTF level 0 expression, see ``format_edtf()``.
+
+    A single value is formatted inline, as it is faster than sending it to an
+    executor.
+    """
+    return format_edtf(edtf_level0, format, locale)
+
+
+async def aformat_edtf_many(
+    values,
+    format="medium",
+    locale=LC_TIME,
+    executor=None,
+    chunksize=1000,
+    errors="raise",
+):
+    """Format many EDTF level 0 expressions, see ``format_edtf_many()``.
+
+    Up to ``chunksize`` values are formatted inline. More values are split in
+    chunks of ``chunksize`` values, which are formatted in the executor.
+
+    :param values: an iterable of Date, Interval, or strings representing
+        EDTF level 0 expressions.
+    :param format: one of "full", "long", "medium", or "short", or a custom
+                   date/time pattern
+    :param locale: a `Locale` object or a locale identifier
+    :param executor: the ``concurrent.futures.Executor`` to format the chunks
+        in, by default the one of the event loop.
+    :param chunksize: the number of values formatted at once.
+    :param errors: "raise" or "return", see ``format_edtf_many()``.
+    :returns: a list of the formatted values, in the order of ``values``.
+    """
+    values = list(values)
+    if len(values) <= chunksize:
+        return format_edtf_many(values, format, locale, errors)
+
+    locale = _get_locale(locale)
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                executor,
+                format_edtf_many,
+                values[i : i + chunksize],
+                format,
+                locale,
+                errors,
+            )
+            for i in range(0, len(values), chunksize)
+        )
+    )
+    return [text for chunk in chunks for text in chunk]
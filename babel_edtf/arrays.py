@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Conversion of many EDTF values to NumPy arrays.
+
+NumPy is an optional dependency, which is installed with:
+
+.. code-block:: console
+
+   $ pip install babel-edtf[numpy]
+"""
+
+import numpy as np
+from edtf import Date, DateAndTime, Interval
+from edtf.parser.parser_classes import PRECISION_DAY, PRECISION_MONTH, PRECISION_YEAR
+
+from . import BOUND_LOWER, BOUND_UPPER
+from .bounds import edtf_to_datetime
+from .formatting import get_interval_precision
+from .parsing import _match_level0, parse_edtf
+
+
+def _match(value):
+    """Match the bounds of a level 0 string or object, or return ``None``."""
+    cls = type(value)
+    if cls is str:
+        edtfstr = value
+    elif cls is Date or cls is Interval:
+        edtfstr = str(value)
+    elif cls is DateAndTime:
+        edtfstr = str(value.date)
+    else:
+        return None
+
+    match = _match_level0(edtfstr)
+    if match is None:
+        return None
+    lower, upper, _ = match
+    return lower, upper or lower
+
+
+def _precision(edtf_date):
+    """Return the precision of a parsed EDTF value, or an empty string."""
+    if isinstance(edtf_date, DateAndTime):
+        return edtf_date.date.precision
+    elif type(edtf_date) is Interval:
+        return get_interval_precision(edtf_date)
+    return getattr(edtf_date, "precision", None) or ""
+
+
+def _months(years, months):
+    """Return the ``datetime64[M]`` of arrays of years and months."""
+    return ((years - 1970) * 12 + months - 1).astype("datetime64[M]")
+
+
+def edtf_to_datetime64(values):
+    """Convert many EDTF values to arrays of their lower and upper bounds.
+
+    Level 0 strings and objects are converted without building EDTF,
+    ``struct_time`` or ``datetime`` objects: only their year, month and day
+    are extracted, and the bounds of all of them are computed at once with
+    NumPy. Other values are parsed and converted with ``edtf_to_datetime()``.
+
+    :param values: a sequence of EDTF strings, or Date, DateAndTime or
+        Interval objects.
+    :returns: a tuple ``(lower, upper, precision)`` of arrays with the strict
+        lower and upper bounds (as ``datetime64[D]``), and the precision of
+        each value ("year", "month" or "day", or "" if unknown).
+    """
+    lower = np.empty(len(values), dtype="datetime64[D]")
+    upper = np.empty(len(values), dtype="datetime64[D]")
+    precision = np.empty(len(values), dtype="U5")
+
+    fast, fields, precisions = [], [], []
+    for i, value in enumerate(values):
+        match = _match(value)
+        if match is None:
+            if isinstance(value, str):
+                value = parse_edtf(value)
+            lower[i] = edtf_to_datetime(value, BOUND_LOWER).date()
+            upper[i] = edtf_to_datetime(value, BOUND_UPPER).date()
+            precision[i] = _precision(value)
+            continue
+
+        (ly, lm, ld), (uy, um, ud) = match
+        fast.append(i)
+        fields.append((ly, lm or 0, ld or 0, uy, um or 0, ud or 0))
+        if ld or ud:
+            precisions.append(PRECISION_DAY)
+        elif lm or um:
+            precisions.append(PRECISION_MONTH)
+        else:
+            precisions.append(PRECISION_YEAR)
+
+    if fast:
+        ly, lm, ld, uy, um, ud = np.array(fields, dtype=np.int64).T
+        lower[fast] = _months(ly, np.where(lm, lm, 1)).astype("datetime64[D]") + (
+            np.where(ld, ld, 1) - 1
+        )
+        month = _months(uy, np.where(um, um, 12))
+        upper[fast] = np.where(
+            ud,
+            month.astype("datetime64[D]") + (ud - 1),
+            (month + 1).astype("datetime64[D]") - 1,
+        )
+        precision[fast] = precisions
+
+    return lower, upper, precision
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2020-2024 CERN.
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Conversion of EDTF dates to their lower and upper bounds."""
+
+from datetime import date, datetime
+
+from edtf import Date, DateAndTime, Interval, struct_time_to_datetime
+from edtf.parser.parser_classes import UnspecifiedIntervalSection, days_in_month
+
+from . import BOUND_LOWER, BOUND_UPPER
+from .compact import CompactDate, CompactInterval
+
+
+def _level0_bound(edtf_date, strict):
+    """Return the ``(year, month, day)`` of a bound of a level 0 value.
+
+    This is what ``lower_strict()`` and ``upper_strict()`` compute, without
+    building ``struct_time`` objects. Returns ``None`` for anything else than
+    level 0 dates, dates and times, and intervals (including their compact
+    representation).
+    """
+    cls = type(edtf_date)
+    if cls is Interval or cls is CompactInterval:
+        edtf_date = edtf_date.lower if strict == BOUND_LOWER else edtf_date.upper
+        cls = type(edtf_date)
+    elif cls is DateAndTime:
+        edtf_date = edtf_date.date
+        cls = type(edtf_date)
+
+    if cls is CompactDate:
+        year, month, day = edtf_date
+    elif cls is Date:
+        year, month, day = edtf_date.year, edtf_date.month, edtf_date.day
+        year, month, day = int(year), int(month) if month else 0, int(day) if day else 0
+    else:
+        return None
+
+    if strict == BOUND_LOWER:
+        return year, month or 1, day or 1
+    month = month or 12
+    return year, month, day or days_in_month(year, month)
+
+
+def _open_bound(edtf_date, strict):
+    """Return the bound of an interval if it is open (".."), or ``None``.
+
+    python-edtf gives infinite bounds for open ends, which are replaced by the
+    first or last representable day.
+    """
+    if not isinstance(edtf_date, Interval):
+        return None
+    section = edtf_date.lower if strict == BOUND_LOWER else edtf_date.upper
+    if type(section) is not UnspecifiedIntervalSection or not section.is_open:
+        return None
+    return datetime.min if strict == BOUND_LOWER else datetime(9999, 12, 31)
+
+
+def edtf_to_datetime(edtf_date, strict):
+    """Convert an EDTF date to a Python date object.
+
+    The EDTF date can also be a ``CompactDate`` or ``CompactInterval``.
+    Open ends of intervals (e.g. of "2020/..") are the first or last
+    representable day, and unknown ends (e.g. of "2020/") are computed like
+    python-edtf does, i.e. ten years from the known end by default.
+    """
+    if strict not in (BOUND_LOWER, BOUND_UPPER):
+        raise ValueError("Invalid value for 'strict' parameter.")
+
+    bound = _level0_bound(edtf_date, strict)
+    if bound is not None:
+        return datetime(*bound)
+
+    bound = _open_bound(edtf_date, strict)
+    if bound is not None:
+        return bound
+
+    if strict == BOUND_LOWER:
+        date = edtf_date.lower_strict()
+    else:
+        date = edtf_date.upper_strict()
+
+    return struct_time_to_datetime(date)
+
+
+def _edtf_to_date(edtf_date, strict):
+    """Convert an EDTF date to a ``datetime.date`` of one of its bounds."""
+    if strict not in (BOUND_LOWER, BOUND_UPPER):
+        raise ValueError("Invalid value for 'strict' parameter.")
+
+    bound = _level0_bound(edtf_date, strict)
+    if bound is not None:
+        return date(*bound)
+    return edtf_to_datetime(edtf_date, strict).date()
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Backends of the cache of formatted text (see ``enable_format_cache()``).
+
+A backend is any object with ``get(key)`` and ``set(key, text)`` methods,
+where ``get()`` returns ``None`` for missing keys, e.g. a wrapper of a
+memcached or Redis client. The keys are strings, which include the versions
+of this package, Babel and the CLDR data, so that entries formatted by other
+versions are not used.
+
+>>> from babel_edtf import LRUCache, enable_format_cache, format_edtf
+>>> from babel_edtf import disable_format_cache
+>>> enable_format_cache(LRUCache(maxsize=1000))
+>>> format_edtf("2020-09", locale="en")
+'Sep 2020'
+>>> disable_format_cache()
+"""
+
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A least-recently-used cache in the memory of the process.
+
+    :param maxsize: the maximum number of cached texts.
+    """
+
+    def __init__(self, maxsize=4096):
+        """Create an empty cache."""
+        self.maxsize = maxsize
+        self._texts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of cached texts."""
+        return len(self._texts)
+
+    def get(self, key):
+        """Return the text of a key, or ``None`` if it is not cached."""
+        with self._lock:
+            text = self._texts.get(key)
+            if text is not None:
+                self._texts.move_to_end(key)
+            return text
+
+    def set(self, key, text):
+        """Cache the text of a key, evicting the least recently used one."""
+        with self._lock:
+            self._texts[key] = text
+            self._texts.move_to_end(key)
+            if len(self._texts) > self.maxsize:
+                self._texts.popitem(last=False)
+
+    def clear(self):
+        """Remove all the cached texts."""
+        with self._lock:
+            self._texts.clear()
+
+
+class SQLiteCache:
+    """A cache in an SQLite database file, shared by the processes of a host.
+
+    The database is in write-ahead logging mode, so that any number of
+    processes read it while another one writes. Each thread of each process
+    opens its own connection on first use (also after a fork). Texts which
+    can't be read within the timeout (e.g. while another process creates the
+    database) are cache misses, and texts which can't be written (e.g. while
+    many processes write at once) are not cached.
+
+    The database is not bounded: the texts of other versions are never read
+    again, but only removed by ``clear()``.
+
+    :param path: the path of the database file, created if it doesn't exist.
+    :param timeout: the seconds to wait for the lock of another process.
+    """
+
+    def __init__(self, path, timeout=1.0):
+        """Create a cache, without opening the database yet."""
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        """Return the connection of the thread, opening it if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS texts "
+                    "(key TEXT PRIMARY KEY, text TEXT NOT NULL) WITHOUT ROWID"
+                )
+            except sqlite3.Error:
+                connection.close()
+                raise
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def get(self, key):
+        """Return the text of a key, or ``None`` if it is not cached."""
+        try:
+            row = (
+                self._connection()
+                .execute("SELECT text FROM texts WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.OperationalError:  # The database is locked.
+            return None
+        return None if row is None else row[0]
+
+    def set(self, key, text):
+        """Cache the text of a key, unless the database stays locked."""
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO texts VALUES (?, ?)", (key, text)
+            )
+        except sqlite3.OperationalError:  # The database is locked.
+            pass
+
+    def clear(self):
+        """Remove all the cached texts, of all versions."""
+        self._connection().execute("DELETE FROM texts")
@@ -0,0 +1,251 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Command line interface to format EDTF values in bulk.
+
+The input is streamed in batches, so that files of any size are formatted in
+constant memory:
+
+.. code-block:: console
+
+   $ babel-edtf --locale da < dates.txt
+   $ babel-edtf --input jsonl --field date --locale de records.jsonl
+   $ babel-edtf --input csv --field date --bound lower --jobs 4 export.csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import islice
+
+from edtf import DateAndTime, Interval
+
+from . import BOUND_LOWER, BOUND_UPPER, formatting
+from .formatting import _get_locale, format_edtf, load_pattern_tables
+from .parallel import _init_worker
+from .parsing import parse_edtf_level0
+
+
+@lru_cache(maxsize=65536)
+def _format_value(value, format, locale, bound):
+    """Format a value, or one of its bounds (cached across lines)."""
+    if bound is None:
+        return format_edtf(value, format, locale)
+
+    edtf_date = parse_edtf_level0(value)
+    if isinstance(edtf_date, DateAndTime):
+        edtf_date = edtf_date.date
+    elif isinstance(edtf_date, Interval):
+        edtf_date = edtf_date.lower if bound == BOUND_LOWER else edtf_date.upper
+    # Through the module, so that the instrumentation applies.
+    return formatting._format_edtf0_date(edtf_date, format, _get_locale(locale), bound)
+
+
+def _format_values(values, format, locale, bound):
+    """Format a chunk of values, returning ``(text, error)`` pairs."""
+    results = []
+    for value in values:
+        if not value:
+            results.append((value, None))
+            continue
+        try:
+            results.append((_format_value(value, format, locale, bound), None))
+        except Exception as e:  # Report invalid values instead of stopping.
+            results.append((None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _read_lines(files):
+    """Yield the lines of files, without their line endings."""
+    for f in files:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def _read_jsonl(files):
+    """Yield the JSON records of files, skipping blank lines."""
+    for f in files:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_csv(files, header):
+    """Yield the rows of CSV files as dicts, and fill in their header."""
+    for f in files:
+        reader = csv.DictReader(f)
+        if not header:
+            header.extend(reader.fieldnames or [])
+        yield from reader
+
+
+def _csv_header(path):
+    """Return the header of a CSV file, empty for an empty file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def _open(paths):
+    """Yield the files of paths one at a time, or stdin if there are none."""
+    if not paths:
+        yield sys.stdin
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            yield f
+
+
+def _batches(iterable, size):
+    """Yield lists of ``size`` items of an iterable (fewer for the last one)."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _positive_int(text):
+    """Return the integer of an argument, which must be at least 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a positive integer")
+    return value
+
+
+def _parser():
+    """Return the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="babel-edtf",
+        description="Localize EDTF level 0 values, one per line or record.",
+    )
+    parser.add_argument("files", nargs="*", help="input files (default: stdin)")
+    parser.add_argument("-l", "--locale", default="en")
+    parser.add_argument(
+        "-f",
+        "--format",
+        default="medium",
+        help='"full", "long", "medium", "short" or a custom pattern',
+    )
+    parser.add_argument(
+        "-b",
+        "--bound",
+        choices=[BOUND_LOWER, BOUND_UPPER],
+        help="only format the lower or upper bound of the values",
+    )
+    parser.add_argument(
+        "--input",
+        choices=["lines", "jsonl", "csv"],
+        default="lines",
+        help="input format (default: one value per line)",
+    )
+    parser.add_argument("--field", help="field with the value (jsonl and csv)")
+    parser.add_argument(
+        "--output-field",
+        help="field to write the formatted value to (default: --field)",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="stop at the first invalid value (default: keep it unchanged)",
+    )
+    parser.add_argument(
+        "--pattern-tables",
+        metavar="FILE",
+        help="load the patterns saved with save_pattern_tables() from FILE",
+    )
+    parser.add_argument("-j", "--jobs", type=_positive_int, default=1)
+    parser.add_argument("--chunksize", type=_positive_int, default=1000)
+    return parser
+
+
+def main(argv=None):
+    """Format the EDTF values of the input and write them to stdout."""
+    args = _parser().parse_args(argv)
+    if args.input != "lines" and not args.field:
+        _parser().error(f"--field is required for --input {args.input}")
+    if args.input == "csv":
+        headers = {tuple(_csv_header(path)) for path in args.files}
+        if len(headers - {()}) > 1:
+            _parser().error("the CSV files have different headers")
+    output_field = args.output_field or args.field
+
+    header = []
+    files = _open(args.files)
+    if args.input == "lines":
+        records = _read_lines(files)
+    elif args.input == "jsonl":
+        records = _read_jsonl(files)
+    else:
+        records = _read_csv(files, header)
+
+    format_values = partial(
+        _format_values, format=args.format, locale=args.locale, bound=args.bound
+    )
+    if args.pattern_tables:
+        load_pattern_tables(args.pattern_tables)
+    executor = None
+    if args.jobs > 1:
+        executor = ProcessPoolExecutor(
+            args.jobs,
+            initializer=_init_worker,
+            initargs=([args.locale], [args.format], args.pattern_tables),
+        )
+
+    out = sys.stdout
+    writer = None
+    line = invalid = 0
+    try:
+        for batch in _batches(records, args.chunksize * args.jobs):
+            if args.input == "lines":
+                values = batch
+            else:
+                values = [
+                    r.get(args.field) if isinstance(r, dict) else None for r in batch
+                ]
+
+            if executor is None:
+                results = format_values(values)
+            else:
+                chunks = _batches(values, args.chunksize)
+                results = [r for rs in executor.map(format_values, chunks) for r in rs]
+
+            for record, value, (text, error) in zip(batch, values, results):
+                line += 1
+                if args.input == "jsonl" and not isinstance(record, dict):
+                    value, error = record, "the record is not a JSON object"
+                if error is not None:
+                    if args.strict:
+                        print(
+                            f"babel-edtf: {line}: {value!r}: {error}", file=sys.stderr
+                        )
+                        return 1
+                    invalid += 1
+                    text = value
+                if args.input == "lines":
+                    out.write(f"{text}\n")
+                    continue
+
+                if text is not None and isinstance(record, dict):
+                    # Records without the field (or not objects) are kept.
+                    record[output_field] = text
+                if args.input == "jsonl":
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                else:
+                    if writer is None:
+                        if output_field not in header:
+                            header.append(output_field)
+                        writer = csv.DictWriter(out, header, lineterminator="\n")
+                        writer.writeheader()
+                    writer.writerow(record)
+    finally:
+        files.close()
+        if executor is not None:
+            executor.shutdown()
+
+    if invalid:
+        print(f"babel-edtf: {invalid} invalid value(s) left unchanged", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
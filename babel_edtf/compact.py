@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Compact representation of EDTF level 0 dates and intervals.
+
+python-edtf objects keep the year, month and day as strings in a per-instance
+dictionary. The named tuples of this module only hold integers, which is much
+smaller when many values are kept in memory (e.g. to sort or index them), and
+they are hashable and ordered by their fields:
+
+>>> from babel_edtf.compact import parse_edtf_compact
+>>> parse_edtf_compact("2020-09")
+CompactDate(year=2020, month=9, day=0)
+>>> parse_edtf_compact("2020") < parse_edtf_compact("2020-09")
+True
+"""
+
+from collections import namedtuple
+
+from edtf import Date, Interval
+from edtf.parser.parser_classes import PRECISION_DAY, PRECISION_MONTH, PRECISION_YEAR
+
+from . import EDTFValueError
+from .parsing import _match_level0
+
+# Precisions by their code, i.e. the number of specified month and day fields.
+_precisions = (PRECISION_YEAR, PRECISION_MONTH, PRECISION_DAY)
+
+
+def _int(value):
+    """Convert a month or day string to an integer, ``0`` if unspecified."""
+    return int(value) if value else 0
+
+
+def _str(value):
+    """Convert a month or day to a string, ``None`` if unspecified."""
+    return f"{value:02d}" if value else None
+
+
+class CompactDate(namedtuple("CompactDate", "year month day")):
+    """A level 0 date, with its month and day ``0`` if unspecified."""
+
+    __slots__ = ()
+
+    @property
+    def precision_code(self):
+        """The precision of the date: 0 for year, 1 for month, 2 for day."""
+        return (self.month > 0) + (self.day > 0)
+
+    @property
+    def precision(self):
+        """The precision of the date: "year", "month" or "day"."""
+        return _precisions[self.precision_code]
+
+    @classmethod
+    def from_edtf(cls, edtf_date):
+        """Convert a python-edtf level 0 ``Date``."""
+        # Level 2 significant digits (e.g. "1950S2") are also a ``Date``.
+        if type(edtf_date) is not Date or edtf_date.significant_digits:
+            raise EDTFValueError("Only an EDTF level 0 date is supported.")
+        try:
+            return cls(int(edtf_date.year), _int(edtf_date.month), _int(edtf_date.day))
+        except ValueError:  # Unspecified digits, e.g. "20XX".
+            raise EDTFValueError("Only an EDTF level 0 date is supported.")
+
+    def to_edtf(self):
+        """Convert to a python-edtf ``Date``."""
+        year = f"{self.year:05d}" if self.year < 0 else f"{self.year:04d}"
+        return Date(year, _str(self.month), _str(self.day))
+
+    def __str__(self):
+        """Return the EDTF string of the date."""
+        return str(self.to_edtf())
+
+
+class CompactInterval(namedtuple("CompactInterval", "lower upper")):
+    """A level 0 interval of two ``CompactDate``."""
+
+    __slots__ = ()
+
+    @property
+    def precision_code(self):
+        """The precision of the interval, i.e. of its most precise bound."""
+        return max(self.lower.precision_code, self.upper.precision_code)
+
+    @property
+    def precision(self):
+        """The precision of the interval, i.e. of its most precise bound."""
+        return _precisions[self.precision_code]
+
+    @classmethod
+    def from_edtf(cls, edtf_interval):
+        """Convert a python-edtf level 0 ``Interval``."""
+        if type(edtf_interval) is not Interval:
+            raise EDTFValueError("Only an EDTF level 0 interval is supported.")
+        return cls(
+            CompactDate.from_edtf(edtf_interval.lower),
+            CompactDate.from_edtf(edtf_interval.upper),
+        )
+
+    def to_edtf(self):
+        """Convert to a python-edtf ``Interval``."""
+        return Interval(self.lower.to_edtf(), self.upper.to_edtf())
+
+    def __str__(self):
+        """Return the EDTF string of the interval."""
+        return f"{self.lower}/{self.upper}"
+
+
+_new_tuple = tuple.__new__
+
+
+def _compact_date(fields):
+    """Build a ``CompactDate`` from matched ``(year, month, day)`` strings.
+
+    The tuple is created directly, which is faster than the named tuple's
+    ``__new__()`` as the fields are known to be valid.
+    """
+    year, month, day = fields
+    return _new_tuple(
+        CompactDate, (int(year), int(month) if month else 0, int(day) if day else 0)
+    )
+
+
+def parse_edtf_compact(edtfstr):
+    """Parse an EDTF level 0 date or interval into its compact representation.
+
+    The string is matched with the compiled level 0 parser, without building
+    python-edtf objects.
+
+    :param edtfstr: an EDTF level 0 date or interval string.
+    :returns: a ``CompactDate`` or ``CompactInterval``.
+    """
+    match = _match_level0(edtfstr)
+    if match is None or match[2] is not None:
+        raise EDTFValueError("The string is not a valid EDTF level 0 date or interval.")
+
+    lower, upper, _ = match
+    if upper is None:
+        return _compact_date(lower)
+    return _new_tuple(CompactInterval, (_compact_date(lower), _compact_date(upper)))
@@ -0,0 +1,697 @@
+# SPDX-FileCopyrightText: 2020-2024 CERN.
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Localization of Extended Date Time Format (EDTF) level 0 expressions."""
+
+import json
+from datetime import date as date_
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+
+from babel import Locale
+from babel import __version__ as babel_version
+from babel.core import get_cldr_version
+from babel.dates import (
+    LC_TIME,
+    PATTERN_CHAR_ORDER,
+    UTC,
+    format_interval,
+    get_date_format,
+    get_datetime_format,
+    get_time_format,
+    match_skeleton,
+    parse_pattern,
+    tokenize_pattern,
+    untokenize_pattern,
+)
+from edtf import Date, DateAndTime, EDTFObject, Interval
+from edtf.parser.parser_classes import (
+    PRECISION_DAY,
+    PRECISION_MONTH,
+    PRECISION_YEAR,
+    Level1Interval,
+    UncertainOrApproximate,
+    UnspecifiedIntervalSection,
+)
+
+from . import BOUND_LOWER, BOUND_UPPER, EDTFTypeError, EDTFValueError
+from .bounds import _edtf_to_date, _level0_bound, edtf_to_datetime
+from .cache import LRUCache
+from .compact import CompactDate, CompactInterval
+from .parsing import _parse_level0_time, parse_edtf_level0
+from .version import __version__
+
+DATE_SKELETON_FORMATS = {
+    PRECISION_YEAR: {
+        "full": "y",
+        "long": "y",
+        "medium": "y",
+        "short": "y",
+    },
+    PRECISION_MONTH: {
+        "full": "yMMMM",
+        "long": "yMMMM",
+        "medium": "yMMM",
+        "short": "yM",
+    },
+    # Day precision is only used for intervals (not for date or date and time)
+    # formatting. This is because the format_skeleton does not format exactly
+    # the same way as format_date, and thus we use format_date to ensure all
+    # dates look the same independently if they where formatted with
+    # format_edtf or format_date.
+    PRECISION_DAY: {
+        "full": "EEEEyMMMMd",
+        "long": "yMMMMd",
+        "medium": "yMMMd",
+        "short": "yMd",
+    },
+}
+
+# Patterns of intervals with an open or unknown end, by locale identifier or
+# language: "since" for intervals with only a lower bound (e.g. "2020/.." or
+# "2020/"), and "until" for intervals with only an upper bound (e.g.
+# "../2020" or "/2020"). Other locales use their fallback interval pattern
+# without the missing bound, e.g. "2020 –".
+OPEN_INTERVAL_FORMATS = {
+    "da": {"since": "siden {0}", "until": "indtil {0}"},
+    "de": {"since": "seit {0}", "until": "bis {0}"},
+    "en": {"since": "since {0}", "until": "until {0}"},
+    "es": {"since": "desde {0}", "until": "hasta {0}"},
+    "fr": {"since": "depuis {0}", "until": "jusqu’à {0}"},
+    "it": {"since": "dal {0}", "until": "fino al {0}"},
+    "ja": {"since": "{0}から", "until": "{0}まで"},
+    "nb": {"since": "siden {0}", "until": "til {0}"},
+    "nl": {"since": "sinds {0}", "until": "tot {0}"},
+    "pt": {"since": "desde {0}", "until": "até {0}"},
+    "sv": {"since": "sedan {0}", "until": "till {0}"},
+}
+
+
+def get_edtf_date_skeleton(precision, format="medium"):
+    """Return the date skeleton for a given precision.
+
+    :param precision: the precision to use, one of "year", "month" or "day"
+    :param format: the format to use, one of "full", "long", "medium", or
+                   "short"
+    """
+    return DATE_SKELETON_FORMATS[precision][format]
+
+
+def get_interval_precision(interval):
+    """Get the precision for an interval."""
+    return _finest_precision(interval.lower.precision, interval.upper.precision)
+
+
+def format_edtf(edtf_level0=None, format="medium", locale=LC_TIME):
+    """Format a EDTF level 0 expression.
+
+    The formatting relies on Babel's skeleton matching and interval formats
+    for all the heavy lifting. The resolved locales and patterns are cached
+    per locale, format and precision (of both bounds for intervals), and
+    formatted exactly like Babel's ``format_date()``, ``format_skeleton()``
+    and ``format_interval()``.
+
+    Intervals of a level 0 date and an open or unknown end (e.g. "2020/.."
+    or "/2020") are formatted with ``OPEN_INTERVAL_FORMATS``, e.g. "since
+    2020" or "until 2020" in English.
+
+    Dates and times are formatted like Babel's ``format_datetime()``, in the
+    time zone of their offset. Times without an offset are local times, and
+    are formatted without a time zone.
+
+    :param edtf_level0: a Date, Interval, or string representing
+        and EDTF level 0 expression, or a ``CompactDate`` or
+        ``CompactInterval``.
+    :param format: one of "full", "long", "medium", or "short", or a custom
+                   date/time pattern
+    :param locale: a `Locale` object or a locale identifier
+    """
+    if edtf_level0 is None:
+        edtf_level0 = date_.today().isoformat()
+
+    if isinstance(edtf_level0, str):
+        if _format_cache is not None:
+            return _format_edtf_cached(edtf_level0, format, locale)
+        edtf_level0 = parse_edtf_level0(edtf_level0)
+    elif isinstance(edtf_level0, CompactDate):
+        return _format_edtf0_date(edtf_level0, format, _get_locale(locale), BOUND_LOWER)
+    elif isinstance(edtf_level0, CompactInterval):
+        return _format_edtf0_interval(edtf_level0, format, _get_locale(locale))
+
+    # Do we have an EDTFObject (directly or parsed from a string)?
+    if not isinstance(edtf_level0, EDTFObject):
+        raise EDTFTypeError(
+            "You must provide either a EDTF formatted string or an EDTF " "object."
+        )
+
+    # Do we have a Date, Interval or DateAndTime?
+    if not isinstance(edtf_level0, (Date, Interval, DateAndTime)):
+        raise EDTFValueError(
+            "Only an EDTF level 0 date, date and time or interval is " "supported."
+        )
+
+    locale = _get_locale(locale)
+
+    if isinstance(edtf_level0, Date):
+        return _format_edtf0_date(edtf_level0, format, locale, BOUND_LOWER)
+    elif isinstance(edtf_level0, DateAndTime):
+        return _format_edtf0_datetime(edtf_level0, format, locale)
+    elif type(edtf_level0) is Level1Interval:
+        return _format_edtf0_open_interval(edtf_level0, format, locale)
+    elif isinstance(edtf_level0, Interval):
+        return _format_edtf0_interval(edtf_level0, format, locale)
+
+
+_format_cache = None
+
+# Version of the keys of the format cache, see ``_format_cache_prefix()``.
+_FORMAT_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=256)
+def _format_cache_prefix(locale):
+    """Return the start of the format cache keys of a locale.
+
+    It includes the versions of the keys, of this package, of Babel and of
+    the CLDR data, so that upgrading any of them invalidates the entries.
+    """
+    versions = f"{_FORMAT_CACHE_VERSION}:{__version__}:{babel_version}"
+    return f"{versions}:{get_cldr_version()}\x1f{_get_locale(locale)}\x1f"
+
+
+def _format_edtf_cached(edtfstr, format, locale):
+    """Format an EDTF string with the format cache."""
+    key = f"{_format_cache_prefix(locale)}{format}\x1f{edtfstr}"
+    text = _format_cache.get(key)
+    if text is None:
+        text = format_edtf(parse_edtf_level0(edtfstr), format, locale)
+        _format_cache.set(key, text)
+    return text
+
+
+def enable_format_cache(cache=None):
+    """Enable a cache of the text of EDTF strings formatted by ``format_edtf()``.
+
+    The cache is disabled by default. Once enabled, ``format_edtf()`` (and
+    thus e.g. ``format_edtf_many()``) looks up the text of an EDTF string,
+    format and locale in the cache before formatting it. Strings which can't
+    be formatted are not cached.
+
+    :param cache: the cache backend (see ``babel_edtf.cache``): by default a
+        new ``LRUCache``, or e.g. a ``SQLiteCache`` shared by the processes of
+        a host.
+    """
+    global _format_cache
+    _format_cache = LRUCache() if cache is None else cache
+
+
+def disable_format_cache():
+    """Disable the cache of formatted text, without clearing its backend."""
+    global _format_cache
+    _format_cache = None
+
+
+def _format_edtf_or_error(value, format, locale):
+    """Format a value, returning the exception instead of raising it."""
+    try:
+        return format_edtf(value, format, locale)
+    except Exception as e:
+        return e
+
+
+def format_edtf_many(values, format="medium", locale=LC_TIME, errors="raise"):
+    """Format many EDTF level 0 expressions in the same format and locale.
+
+    The locale is parsed only once, and identical strings are formatted only
+    once.
+
+    :param values: an iterable of Date, Interval, or strings representing
+        EDTF level 0 expressions.
+    :param format: one of "full", "long", "medium", or "short", or a custom
+                   date/time pattern
+    :param locale: a `Locale` object or a locale identifier
+    :param errors: "raise" to raise the exception of the first value which
+        can't be formatted, or "return" to return the exception in place of
+        its text (e.g. to report invalid records of a batch).
+    :returns: a list of the formatted values, in the order of ``values``.
+    """
+    if errors == "raise":
+        format_value = format_edtf
+    elif errors == "return":
+        format_value = _format_edtf_or_error
+    else:
+        raise ValueError("Invalid value for 'errors' parameter.")
+
+    locale = _get_locale(locale)
+    formatted = {}
+    result = []
+    for value in values:
+        if isinstance(value, str):
+            text = formatted.get(value)
+            if text is None:
+                text = formatted[value] = format_value(value, format, locale)
+        else:
+            text = format_value(value, format, locale)
+        result.append(text)
+    return result
+
+
+# Date patterns and interval skeletons loaded by ``load_pattern_tables()``,
+# by locale identifier, format and precision.
+_pattern_tables = {}
+
+# Version of the file format of ``save_pattern_tables()``.
+_PATTERN_TABLES_VERSION = 1
+
+
+@lru_cache(maxsize=256)
+def _get_locale(locale):
+    """Return the (cached) ``Locale`` for a locale identifier."""
+    return Locale.parse(locale)
+
+
+def _get_skeleton(precision, format):
+    """Return the skeleton for a precision, or the custom pattern."""
+    if format in ("full", "long", "medium", "short"):
+        return get_edtf_date_skeleton(precision, format)
+    return format
+
+
+@lru_cache(maxsize=1024)
+def _get_date_pattern(locale, format, precision):
+    """Resolve the Babel date pattern to format a date of a given precision.
+
+    This is what ``format_date()`` and ``format_skeleton()`` resolve on every
+    call, including the expensive fuzzy matching of skeletons.
+    """
+    loaded = _pattern_tables.get((str(locale), format, precision))
+    if loaded is not None:
+        return parse_pattern(loaded[0])
+
+    if precision == PRECISION_DAY:
+        # Day precision: use normal date formatter
+        if format in ("full", "long", "medium", "short"):
+            return get_date_format(format, locale=locale)
+        return parse_pattern(format)
+
+    # Year or month precision: Use skeleton formatting
+    skeleton = _get_skeleton(precision, format)
+    if skeleton not in locale.datetime_skeletons:
+        skeleton = match_skeleton(skeleton, locale.datetime_skeletons)
+    return parse_pattern(locale.datetime_skeletons[skeleton])
+
+
+@lru_cache(maxsize=1024)
+def _get_interval_skeleton(locale, format, precision):
+    """Resolve the skeleton of the locale's interval formats to use.
+
+    This is the fuzzy matching ``format_interval()`` does on every call.
+    Returns ``None`` if there is no match, in which case ``format_interval()``
+    uses its fallback.
+    """
+    loaded = _pattern_tables.get((str(locale), format, precision))
+    if loaded is not None:
+        return loaded[1]
+
+    skeleton = _get_skeleton(precision, format)
+    if skeleton and skeleton not in locale.interval_formats:
+        skeleton = match_skeleton(skeleton, locale.interval_formats)
+    return skeleton
+
+
+# The index in ``(year, month, day)`` of the greatest difference fields of
+# interval formats which can differ between the bounds of level 0 values.
+_interval_fields = {"y": 0, "M": 1, "d": 2}
+
+
+@lru_cache(maxsize=1024)
+def _get_interval_patterns(locale, skeleton):
+    """Resolve the patterns ``format_interval()`` formats a skeleton with.
+
+    Returns the pattern of intervals with equal bounds, and the patterns of
+    the start and end of the interval by greatest difference field, in the
+    order ``format_interval()`` looks for the field. The fields are given by
+    their index in ``(year, month, day)``: the time fields are left out, as
+    they never differ between the bounds (at midnight) of level 0 values.
+    The fields are ``None`` if there is an era field, which Babel fails to
+    compare.
+    """
+    single = skeleton
+    if single not in locale.datetime_skeletons:
+        single = match_skeleton(single, locale.datetime_skeletons)
+    single = parse_pattern(locale.datetime_skeletons[single])
+
+    skel_formats = locale.interval_formats[skeleton]
+    if "G" in skel_formats:
+        return single, None
+
+    fields = tuple(
+        (
+            _interval_fields[field],
+            tuple(parse_pattern(pattern) for pattern in skel_formats[field][:2]),
+        )
+        for field in PATTERN_CHAR_ORDER
+        if field in skel_formats and field in _interval_fields
+    )
+    return single, fields
+
+
+# The widths of the names of era, month and weekday fields by their count.
+_name_widths = {3: "abbreviated", 4: "wide", 5: "narrow", 6: "short"}
+
+
+def _name_table(names, keys):
+    """Return a list of the names of a Babel names dictionary by key."""
+    table = [None] * (max(keys) + 1)
+    for key in keys:
+        table[key] = names[key]
+    return table
+
+
+def _date_field(locale, char, num):
+    """Return a function formatting a field of a ``date`` like Babel.
+
+    This is what ``DateTimeFormat`` does for the era, year, month, day and
+    weekday fields, with the names of the locale looked up once. Returns
+    ``None`` for other fields.
+    """
+    if char == "G" and num <= 5:
+        eras = _name_table(locale.eras[_name_widths[max(3, num)]], (0, 1))
+        return lambda value: eras[value.year >= 0]
+    elif char in "yu":
+        if num == 2:
+            return lambda value: ("%02d" % value.year)[-2:]
+        return lambda value: "%0*d" % (num, value.year)
+    elif char in "ML" and num <= 2:
+        return lambda value: "%0*d" % (num, value.month)
+    elif char in "ML" and num <= 5:
+        context = "format" if char == "M" else "stand-alone"
+        months = locale.months[context][_name_widths[num]]
+        months = _name_table(months, range(1, 13))
+        return lambda value: months[value.month]
+    elif char == "d":
+        return lambda value: "%0*d" % (num, value.day)
+    elif char in "ec" and num < 3:
+        first = 7 - locale.first_week_day
+        return lambda value: "%0*d" % (num, (first + value.weekday()) % 7 + 1)
+    elif char in "Eec" and num <= 6:
+        context = "stand-alone" if char == "c" else "format"
+        days = locale.days[context][_name_widths[max(3, num)]]
+        days = _name_table(days, range(7))
+        return lambda value: days[value.weekday()]
+    return None
+
+
+def _compile_pattern(pattern, locale):
+    """Compile a date pattern into a function formatting a ``date``.
+
+    The function only substitutes the fields into the text of the pattern,
+    which formats exactly like ``pattern.apply(value, locale)``. Patterns
+    with other fields than those of ``_date_field()`` (e.g. hours) are
+    applied with Babel to the midnight UTC of the date, like
+    ``format_interval()`` does.
+    """
+    parts = []
+    fields = []
+    for kind, value in tokenize_pattern(pattern.pattern):
+        if kind == "chars":
+            parts.append(value.replace("%", "%%"))
+            continue
+        field = _date_field(locale, *value)
+        if field is None:
+            return lambda value: pattern.apply(
+                datetime.combine(value, time(), UTC), locale
+            )
+        parts.append("%s")
+        fields.append(field)
+
+    text = "".join(parts)
+    return lambda value: text % tuple([field(value) for field in fields])
+
+
+def _finest_precision(*precisions):
+    """Return the finest of the precisions, ``None`` if none is known."""
+    for p in [PRECISION_DAY, PRECISION_MONTH, PRECISION_YEAR]:
+        if p in precisions:
+            return p
+
+
+@lru_cache(maxsize=1024)
+def _get_interval_engine(locale, format, lower_precision, upper_precision):
+    """Resolve how intervals with bounds of two precisions are formatted.
+
+    Returns ``None`` if ``format_interval()`` uses its fallback for them, or
+    the patterns of ``_get_interval_patterns()`` compiled with
+    ``_compile_pattern()``, so that formatting an interval only substitutes
+    the fields of its bounds.
+    """
+    precision = _finest_precision(lower_precision, upper_precision)
+    skeleton = _get_interval_skeleton(locale, format, precision)
+    if not skeleton or skeleton not in locale.interval_formats:
+        return None
+
+    single, fields = _get_interval_patterns(locale, skeleton)
+    if fields is not None:
+        fields = tuple(
+            (index, tuple(_compile_pattern(p, locale) for p in patterns))
+            for index, patterns in fields
+        )
+    return _compile_pattern(single, locale), fields
+
+
+# Time zone fields of patterns, see ``_strip_zone()``.
+_zone_fields = "zZOvVXx"
+
+
+def _strip_zone(pattern):
+    """Remove the time zone fields of a pattern, with their separators.
+
+    E.g. "h:mm:ss a (zzzz)" becomes "h:mm:ss a".
+    """
+    tokens = []
+    strip = False
+    for kind, value in tokenize_pattern(pattern):
+        if kind == "field" and value[0] in _zone_fields:
+            if tokens and tokens[-1][0] == "chars":
+                tokens[-1] = ("chars", tokens[-1][1].rstrip(" ,([\u202f"))
+            strip = True
+            continue
+        if strip and kind == "chars":
+            value = value.lstrip(" )]\u202f")
+        strip = False
+        tokens.append((kind, value))
+    return untokenize_pattern(token for token in tokens if token[1])
+
+
+@lru_cache(maxsize=1024)
+def _get_datetime_patterns(locale, format, zone):
+    """Resolve the Babel patterns to format a date and time.
+
+    Returns the pattern combining the date and the time (``None`` for a
+    custom pattern, which formats both), and the time pattern (or the custom
+    pattern), without its time zone fields unless ``zone``. This is what
+    ``format_datetime()`` resolves on every call.
+    """
+    if format not in ("full", "long", "medium", "short"):
+        return None, parse_pattern(format if zone else _strip_zone(format))
+
+    time_pattern = get_time_format(format, locale=locale)
+    if not zone:
+        time_pattern = parse_pattern(_strip_zone(time_pattern.pattern))
+    return get_datetime_format(format, locale=locale).replace("'", ""), time_pattern
+
+
+def warm_up(locales, formats=("full", "long", "medium", "short")):
+    """Resolve the locales and patterns used by ``format_edtf()`` up front.
+
+    Loading the locale data and resolving the patterns of a locale is
+    otherwise done by the first calls to ``format_edtf()`` with it.
+
+    :param locales: the `Locale` objects or locale identifiers to resolve.
+    :param formats: the formats to resolve for each of the locales.
+    """
+    for locale in locales:
+        locale = _get_locale(locale)
+        locale.date_formats  # Load the locale data, even if patterns are loaded.
+        for format in formats:
+            for precision in DATE_SKELETON_FORMATS:
+                _get_date_pattern(locale, format, precision)
+                for upper in DATE_SKELETON_FORMATS:
+                    _get_interval_engine(locale, format, precision, upper)
+            for zone in (False, True):
+                _get_datetime_patterns(locale, format, zone)
+
+
+def save_pattern_tables(path, locales, formats=("full", "long", "medium", "short")):
+    """Save the patterns resolved for locales and formats to a file.
+
+    The file can be loaded with ``load_pattern_tables()``, e.g. when starting
+    worker processes, instead of resolving the patterns again.
+
+    :param path: the path of the file to write.
+    :param locales: the `Locale` objects or locale identifiers to save.
+    :param formats: the formats to save for each of the locales.
+    """
+    patterns = []
+    for locale in locales:
+        locale = _get_locale(locale)
+        for format in formats:
+            for precision in DATE_SKELETON_FORMATS:
+                patterns.append(
+                    [
+                        str(locale),
+                        format,
+                        precision,
+                        _get_date_pattern(locale, format, precision).pattern,
+                        _get_interval_skeleton(locale, format, precision),
+                    ]
+                )
+    tables = {
+        "version": _PATTERN_TABLES_VERSION,
+        "babel": babel_version,
+        "patterns": patterns,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tables, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_pattern_tables(path):
+    """Load the patterns saved with ``save_pattern_tables()``, and warm up.
+
+    Patterns saved with another version of Babel (and thus of the CLDR data)
+    are ignored, and resolved again when needed.
+
+    :param path: the path of the file to read.
+    :returns: whether the patterns were loaded.
+    """
+    with open(path, encoding="utf-8") as f:
+        tables = json.load(f)
+    if (
+        tables.get("version") != _PATTERN_TABLES_VERSION
+        or tables.get("babel") != babel_version
+    ):
+        return False
+
+    locales, formats = {}, {}
+    for locale, format, precision, pattern, skeleton in tables["patterns"]:
+        _pattern_tables[locale, format, precision] = (pattern, skeleton)
+        locales[locale] = formats[format] = None
+    warm_up(locales, formats)
+    return True
+
+
+def _format_edtf0_date(edtf_date, format, locale, strict):
+    """Format an EDTF level 0 date."""
+    # Convert EDTFDate to a python Date
+    if edtf_date.precision == PRECISION_DAY:
+        dt = _edtf_to_date(edtf_date, strict)
+    else:
+        dt = edtf_to_datetime(edtf_date, strict)
+
+    pattern = _get_date_pattern(locale, format, edtf_date.precision)
+    return pattern.apply(dt, locale)
+
+
+def _format_edtf0_interval_naive(edtf_interval, format, locale):
+    """Format an EDTF level 0 interval."""
+    dt_start = _edtf_to_date(edtf_interval.lower, BOUND_LOWER)
+    dt_end = _edtf_to_date(edtf_interval.upper, BOUND_UPPER)
+
+    precision = get_interval_precision(edtf_interval)
+    skeleton = _get_interval_skeleton(locale, format, precision)
+
+    return format_interval(dt_start, dt_end, skeleton, fuzzy=True, locale=locale)
+
+
+def _format_edtf0_interval(edtf_interval, format, locale):
+    """Format an EDTF level 0 interval.
+
+    This formats like ``_format_edtf0_interval_naive()``, but with the
+    compiled patterns of ``_get_interval_engine()`` for the precisions of the
+    bounds, instead of resolving and applying them in ``format_interval()``
+    on every call.
+    """
+    engine = _get_interval_engine(
+        locale, format, edtf_interval.lower.precision, edtf_interval.upper.precision
+    )
+    start = _level0_bound(edtf_interval, BOUND_LOWER)
+    end = _level0_bound(edtf_interval, BOUND_UPPER)
+    if engine is None or start is None or end is None:
+        return _format_edtf0_interval_naive(edtf_interval, format, locale)
+
+    single, fields = engine
+    if start == end:
+        return single(date_(*start))
+    if fields is None:
+        return _format_edtf0_interval_naive(edtf_interval, format, locale)
+
+    for index, patterns in fields:
+        if start[index] != end[index]:
+            instants = (date_(*start), date_(*end))
+            return "".join(
+                pattern(instant) for pattern, instant in zip(patterns, instants)
+            )
+
+    # No greatest difference field, e.g. for "2020/2020": Babel's fallback.
+    return _format_edtf0_interval_naive(edtf_interval, format, locale)
+
+
+def _get_open_interval_pattern(locale, key):
+    """Return the "since" or "until" pattern of ``OPEN_INTERVAL_FORMATS``."""
+    formats = OPEN_INTERVAL_FORMATS.get(str(locale))
+    if formats is None:
+        formats = OPEN_INTERVAL_FORMATS.get(locale.language)
+    if formats is not None:
+        return formats[key]
+
+    fallback = locale.interval_formats.get(None, "{0}-{1}")
+    if key == "since":
+        return fallback.replace("{1}", "").strip()
+    return fallback.replace("{0}", "").replace("{1}", "{0}").strip()
+
+
+def _format_edtf0_open_interval(edtf_interval, format, locale):
+    """Format an interval of a level 0 date and an open or unknown end."""
+    lower, upper = edtf_interval.lower, edtf_interval.upper
+    if type(upper) is UnspecifiedIntervalSection:
+        key, known = "since", lower
+    elif type(lower) is UnspecifiedIntervalSection:
+        key, known = "until", upper
+    else:
+        known = None
+    if (
+        type(known) is not UncertainOrApproximate
+        or known.ua is not None
+        or type(known.date) is not Date
+    ):
+        raise EDTFValueError(
+            "Only an EDTF level 0 interval, or an interval of a level 0 date "
+            "and an open or unknown end is supported."
+        )
+
+    text = _format_edtf0_date(known.date, format, locale, BOUND_LOWER)
+    return _get_open_interval_pattern(locale, key).replace("{0}", text)
+
+
+def _format_edtf0_datetime(edtf_datetime, format, locale):
+    """Format an EDTF level 0 date and time."""
+    edtf_date = edtf_datetime.date
+    hour, minute, second, tzinfo = _parse_level0_time(edtf_datetime.time)
+    dt = datetime.combine(
+        _edtf_to_date(edtf_date, BOUND_LOWER),
+        time(hour % 24, minute, second, tzinfo=tzinfo),
+    )
+    if hour == 24:  # The end of the day, i.e. midnight of the next day.
+        dt += timedelta(days=1)
+
+    combined, time_pattern = _get_datetime_patterns(locale, format, tzinfo is not None)
+    if combined is None:
+        return time_pattern.apply(dt, locale)
+
+    if edtf_date.precision == PRECISION_DAY:
+        date_text = _get_date_pattern(locale, format, PRECISION_DAY).apply(dt, locale)
+    else:
+        date_text = _format_edtf0_date(edtf_date, format, locale, BOUND_LOWER)
+    time_text = time_pattern.apply(dt.timetz(), locale, reference_date=dt.date())
+    return combined.replace("{0}", time_text).replace("{1}", date_text)
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Histograms of EDTF values, e.g. for decade, year or month facets.
+
+Values are counted in every bucket they span, from the bucket of their strict
+lower bound to the one of their strict upper bound (see
+``edtf_to_datetime()``), and the buckets are labelled with ``format_edtf()``:
+
+>>> from babel_edtf import edtf_histogram
+>>> for bucket in edtf_histogram(["2020-10", "2020-09/2021-02"], locale="en"):
+...     print(bucket)
+Bucket(edtf='2020', label='2020', count=2)
+Bucket(edtf='2021', label='2021', count=1)
+>>> edtf_histogram(["2020-10", "2020-09/2021-02"], "month", locale="de")[1]
+Bucket(edtf='2020-10', label='Okt. 2020', count=2)
+"""
+
+from collections import namedtuple
+from datetime import date
+
+from babel.dates import LC_TIME
+
+from . import BOUND_LOWER, BOUND_UPPER, EDTFValueError
+from .bounds import _level0_bound, _open_bound, edtf_to_datetime
+from .formatting import format_edtf_many
+from .parsing import _match_level0, parse_edtf
+
+# The number of months in the buckets of each granularity.
+GRANULARITIES = {"century": 1200, "decade": 120, "year": 12, "month": 1}
+
+Bucket = namedtuple("Bucket", "edtf label count")
+Bucket.__doc__ = """A bucket of a histogram.
+
+``edtf`` is the EDTF level 0 string of the bucket (e.g. "1990/1999" for a
+decade, or "1990-09" for a month), and ``label`` its formatted text, or
+``None`` if it can't be formatted (before year 1).
+"""
+
+
+def _bounds(value):
+    """Return the ``(year, month, day)`` of the strict bounds of a value.
+
+    Level 0 strings and objects are converted without building ``datetime``
+    objects (the day of an upper bound is at least its last day). Anything
+    else is parsed, and converted with ``edtf_to_datetime()``, except for
+    open ends (e.g. of "2020/..") which are ``None``.
+    """
+    if isinstance(value, date):
+        return value.timetuple()[:3], value.timetuple()[:3]
+    if isinstance(value, str):
+        match = _match_level0(value)
+        if match is not None:
+            lower, upper, _ = match
+            if upper is None:
+                upper = lower
+            return (
+                (int(lower[0]), int(lower[1] or 1), int(lower[2] or 1)),
+                (int(upper[0]), int(upper[1] or 12), int(upper[2] or 31)),
+            )
+        value = parse_edtf(value)
+
+    lower = _level0_bound(value, BOUND_LOWER)
+    if lower is not None:
+        return lower, _level0_bound(value, BOUND_UPPER)
+    return tuple(
+        (
+            None
+            if _open_bound(value, strict) is not None
+            else edtf_to_datetime(value, strict).timetuple()[:3]
+        )
+        for strict in (BOUND_LOWER, BOUND_UPPER)
+    )
+
+
+def _months(value):
+    """Return the month numbers (``year * 12 + month - 1``) of the bounds.
+
+    The month numbers of open ends are ``None``.
+    """
+    lower, upper = _bounds(value)
+    if lower is not None and upper is not None and upper < lower:
+        raise EDTFValueError("The interval ends before it starts.")
+    return (
+        None if lower is None else lower[0] * 12 + lower[1] - 1,
+        None if upper is None else upper[0] * 12 + upper[1] - 1,
+    )
+
+
+def _year(year):
+    """Return the EDTF string of a year."""
+    return f"{year:05d}" if year < 0 else f"{year:04d}"
+
+
+def _bucket_edtf(bucket, size):
+    """Return the EDTF string of a bucket of ``size`` months."""
+    if size == 1:
+        year, month = divmod(bucket, 12)
+        return f"{_year(year)}-{month + 1:02d}"
+    elif size == 12:
+        return _year(bucket)
+    years = size // 12
+    return f"{_year(bucket * years)}/{_year(bucket * years + years - 1)}"
+
+
+def edtf_histogram(
+    values, granularity="year", format="medium", locale=LC_TIME, start=None, end=None
+):
+    """Count EDTF values in buckets of a granularity.
+
+    A value is counted in every bucket it spans: e.g. "1998/2003" is in the
+    decades 1990/1999 and 2000/2009. Centuries and decades start at years
+    divisible by 100 and 10.
+
+    :param values: an iterable of EDTF strings, or EDTF objects, or a
+        ``CompactDate`` or ``CompactInterval``.
+    :param granularity: one of "century", "decade", "year" or "month".
+    :param format: the format of the labels, see ``format_edtf()``.
+    :param locale: the locale of the labels, see ``format_edtf()``.
+    :param start: if given, the buckets before the one of the lower bound of
+        this value (or ``date``) are left out. Otherwise, open ends of
+        intervals (e.g. of "../2020") start at the earliest bound of the
+        values.
+    :param end: if given, the buckets after the one of the upper bound of
+        this value (or ``date``) are left out. Otherwise, open ends of
+        intervals (e.g. of "2020/..") end at the latest bound of the values.
+    :returns: a list of the ``Bucket`` of each non-empty bucket, in
+        chronological order.
+    """
+    size = GRANULARITIES.get(granularity)
+    if size is None:
+        raise ValueError("Invalid value for 'granularity' parameter.")
+    months = [_months(value) for value in values]
+    bounds = [month for pair in months for month in pair if month is not None]
+    first = min(bounds, default=None) if start is None else _months(start)[0]
+    last = max(bounds, default=None) if end is None else _months(end)[1]
+
+    # The changes of the count at the start and after the end of the values.
+    changes = {}
+    for lower, upper in months:
+        if lower is None or first is not None and lower < first:
+            lower = first
+        if upper is None or last is not None and upper > last:
+            upper = last
+        if lower is None or upper is None:  # Only open ends.
+            continue
+        lower, upper = lower // size, upper // size
+        if lower <= upper:
+            changes[lower] = changes.get(lower, 0) + 1
+            changes[upper + 1] = changes.get(upper + 1, 0) - 1
+
+    buckets = []
+    count = 0
+    bounds = sorted(changes)
+    for bucket, next_bucket in zip(bounds, bounds[1:]):
+        count += changes[bucket]
+        if count:
+            buckets.extend((b, count) for b in range(bucket, next_bucket))
+
+    edtfs = [_bucket_edtf(bucket, size) for bucket, _ in buckets]
+    labels = format_edtf_many(edtfs, format, locale, errors="return")
+    return [
+        Bucket(edtf, None if isinstance(label, Exception) else label, count)
+        for edtf, label, (_, count) in zip(edtfs, labels, buckets)
+    ]
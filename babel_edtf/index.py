@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Index of EDTF level 0 values for overlap and containment queries.
+
+The values are indexed by the ordinals of their bounds (see
+``edtf_ordinals()``), in sorted lists of ``(lower, upper, number)`` tuples,
+where the number tells apart values with the same bounds. To find the values
+overlapping a query with a bisection, the values are grouped by the power of
+two of their length in days: the values of a group are at most twice as long
+as the shortest one, so only the values starting a group's maximum length
+before the query can overlap it.
+
+>>> from babel_edtf import EDTFIndex
+>>> index = EDTFIndex([("a", "2020"), ("b", "2020-09/2021-02"), ("c", "2021")])
+>>> index.overlapping("2020-12/2021-01")
+['a', 'b', 'c']
+>>> index.within("2020")
+['a']
+>>> index.at("2020-10-01")
+['a', 'b']
+"""
+
+from bisect import bisect_left, insort
+from datetime import date
+from itertools import count
+
+from . import EDTFValueError
+from .keys import edtf_ordinals
+
+
+def _ordinals(value):
+    """Return the ordinals of the bounds of a value or a ``date``."""
+    if isinstance(value, date):
+        ordinal = value.toordinal()
+        return ordinal, ordinal
+    lower, upper, _ = edtf_ordinals(value)
+    if upper < lower:
+        raise EDTFValueError("The interval ends before it starts.")
+    return lower, upper
+
+
+def _group(lower, upper):
+    """Return the group of a value: the power of two of its length in days."""
+    return (upper - lower + 1).bit_length() - 1
+
+
+class EDTFIndex:
+    """An index of EDTF level 0 values by key, e.g. the ids of records.
+
+    Queries take time logarithmic in the number of values (plus the number of
+    results), instead of comparing the bounds of every value.
+
+    Intervals ending before they start are rejected, as they don't overlap
+    or contain anything.
+
+    :param items: an iterable of ``(key, value)`` pairs to bulk load, where
+        the values are EDTF level 0 strings, or a Date, DateAndTime,
+        Interval, ``CompactDate`` or ``CompactInterval``.
+    """
+
+    def __init__(self, items=()):
+        """Create an index, and bulk load items."""
+        self._groups = {}  # Sorted lists of (lower, upper, number) by group.
+        self._entries = {}  # The (lower, upper, number) of each key.
+        self._keys = {}  # The key of each number.
+        self._numbers = count()
+        self.update(items)
+
+    def __len__(self):
+        """Return the number of indexed values."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Return whether a key is indexed."""
+        return key in self._entries
+
+    def __iter__(self):
+        """Iterate over the keys of the indexed values."""
+        return iter(self._entries)
+
+    def _add(self, key, lower, upper):
+        """Add the bounds of a key which isn't indexed, returning its entry."""
+        entry = self._entries[key] = (lower, upper, next(self._numbers))
+        self._keys[entry[2]] = key
+        return entry
+
+    def insert(self, key, value):
+        """Index a value, replacing the value of the key if it is indexed."""
+        lower, upper = _ordinals(value)
+        if key in self._entries:
+            self.delete(key)
+        entry = self._add(key, lower, upper)
+        insort(self._groups.setdefault(_group(lower, upper), []), entry)
+
+    def update(self, items):
+        """Index many ``(key, value)`` pairs at once.
+
+        The bounds of all the values are computed first (the last value of a
+        repeated key wins), so that an invalid value leaves the index
+        unchanged. The values are then added to the index, and sorted once.
+        """
+        bounds = {}
+        for key, value in items:
+            bounds[key] = _ordinals(value)
+        for key in bounds:
+            if key in self._entries:
+                self.delete(key)
+        added = set()
+        for key, (lower, upper) in bounds.items():
+            group = _group(lower, upper)
+            self._groups.setdefault(group, []).append(self._add(key, lower, upper))
+            added.add(group)
+        for group in added:
+            self._groups[group].sort()
+
+    def delete(self, key):
+        """Remove the value of a key from the index.
+
+        :raises KeyError: if the key is not indexed.
+        """
+        lower, upper, number = entry = self._entries.pop(key)
+        del self._keys[number]
+        entries = self._groups[_group(lower, upper)]
+        del entries[bisect_left(entries, entry)]
+
+    def _query(self, start, stop, match):
+        """Return the keys of the entries matching a query.
+
+        ``start(group, longest)`` gives the first lower bound to check in a
+        group of values at most ``longest`` days long (``None`` to skip the
+        group), ``stop`` the last one, and ``match(entry)`` whether an entry
+        matches.
+        """
+        found = []
+        for group, entries in self._groups.items():
+            first = start(group, 2 ** (group + 1) - 1)
+            if first is None:
+                continue
+            i = bisect_left(entries, (first,))
+            j = bisect_left(entries, (stop + 1,))
+            found.extend(entry for entry in entries[i:j] if match(entry))
+        found.sort()
+        return [self._keys[entry[2]] for entry in found]
+
+    def overlapping(self, value):
+        """Return the keys of the values overlapping a value.
+
+        :param value: an EDTF level 0 value (see ``edtf_ordinals()``) or a
+            ``date``.
+        :returns: the keys, ordered by the bounds of their values.
+        """
+        lower, upper = _ordinals(value)
+        return self._query(
+            lambda group, longest: lower - longest + 1,
+            upper,
+            lambda entry: entry[1] >= lower,
+        )
+
+    def within(self, value):
+        """Return the keys of the values within a value (including it).
+
+        See ``overlapping()`` for the parameters.
+        """
+        lower, upper = _ordinals(value)
+        span = upper - lower + 1
+        return self._query(
+            lambda group, longest: lower if 2**group <= span else None,
+            upper,
+            lambda entry: entry[1] <= upper,
+        )
+
+    def containing(self, value):
+        """Return the keys of the values containing a value (including it).
+
+        See ``overlapping()`` for the parameters.
+        """
+        lower, upper = _ordinals(value)
+        span = upper - lower + 1
+        return self._query(
+            lambda group, longest: upper - longest + 1 if longest >= span else None,
+            lower,
+            lambda entry: entry[1] >= upper,
+        )
+
+    def at(self, day):
+        """Return the keys of the values including a day.
+
+        :param day: a ``date``, or an EDTF level 0 value of day precision.
+        :returns: the keys, ordered by the bounds of their values.
+        """
+        lower, upper = _ordinals(day)
+        if lower != upper:
+            raise EDTFValueError("Only a day is supported.")
+        return self.containing(day)
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Opt-in instrumentation of the stages of parsing and formatting.
+
+Once enabled, the calls of each stage are counted and timed:
+
+- ``parse.fast_path``: the compiled level 0 parser, which hits if it parsed
+  the string (see ``parse_edtf()``).
+- ``parse.grammar``: the fallback to python-edtf's grammar.
+- ``parse.leap_year``: the leap year validation of the grammar's results,
+  once per result.
+- ``format.date``: the Babel formatting of dates, including the dates of
+  dates and times and of intervals with an open or unknown end, and the
+  bounds formatted by the ``babel-edtf --bound`` command.
+- ``format.interval``: the Babel formatting of intervals, including the ones
+  with an open or unknown end.
+- ``format.datetime``: the Babel formatting of dates and times.
+
+The stages are the functions doing the work, so a call may record several
+stages (e.g. "2020/.." records ``format.interval`` and ``format.date``), and
+results served from a cache (see ``enable_format_cache()``) record none.
+They are instrumented by replacing their functions while it is enabled, so
+that it costs nothing when disabled.
+"""
+
+import threading
+from collections import namedtuple
+from time import perf_counter_ns
+
+from . import formatting, parsing
+
+# The stage, and the module and name of each function of a stage, and
+# whether it is the fast path (which hits if it returns a result).
+_functions = [
+    ("parse.fast_path", parsing, "_parse_level0", True),
+    ("parse.grammar", parsing, "edtf_parse_edtf", False),
+    ("parse.leap_year", parsing, "_validate_leap_year", False),
+    ("format.date", formatting, "_format_edtf0_date", False),
+    ("format.interval", formatting, "_format_edtf0_interval", False),
+    ("format.interval", formatting, "_format_edtf0_open_interval", False),
+    ("format.datetime", formatting, "_format_edtf0_datetime", False),
+]
+
+StageInfo = namedtuple("StageInfo", "calls hits total max")
+StageInfo.__doc__ = """Statistics of a stage.
+
+The ``hits`` are the calls that succeeded (for the fast path, the calls that
+parsed the string), and ``total`` and ``max`` the total and the longest
+duration of the calls in seconds.
+"""
+
+_lock = threading.Lock()
+_stats = None
+_callback = None
+
+
+def _record(stage, duration, hit):
+    """Record a call of a stage, with its duration in nanoseconds."""
+    with _lock:
+        stats, callback = _stats, _callback
+        if stats is None:  # Disabled while the call was running.
+            return
+        stats = stats[stage]
+        stats[0] += 1
+        stats[1] += hit
+        stats[2] += duration
+        if duration > stats[3]:
+            stats[3] = duration
+    if callback is not None:
+        callback(stage, duration / 1e9, hit)
+
+
+def _instrument(stage, func, fast_path):
+    """Return a function recording the calls of ``func``."""
+
+    def instrumented(*args, **kwargs):
+        hit = False
+        start = perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+            hit = result is not None if fast_path else True
+            return result
+        finally:
+            _record(stage, perf_counter_ns() - start, hit)
+
+    instrumented.__wrapped__ = func
+    return instrumented
+
+
+def enable_instrumentation(callback=None):
+    """Enable the instrumentation of the stages of parsing and formatting.
+
+    If it was already enabled, its statistics are cleared.
+
+    :param callback: a function called after each call of a stage with the
+        name of the stage, its duration in seconds and whether it hit, e.g.
+        to export them to a metrics system.
+    """
+    global _stats, _callback
+    with _lock:
+        _disable()
+        _stats = {stage: [0, 0, 0, 0] for stage, *_ in _functions}
+        _callback = callback
+        for stage, module, name, fast_path in _functions:
+            func = getattr(module, name)
+            setattr(module, name, _instrument(stage, func, fast_path))
+
+
+def _disable():
+    """Disable the instrumentation, with the lock held."""
+    global _stats, _callback
+    if _stats is None:
+        return
+    for _, module, name, _ in _functions:
+        setattr(module, name, getattr(module, name).__wrapped__)
+    _stats = _callback = None
+
+
+def disable_instrumentation():
+    """Disable the instrumentation, and drop its statistics."""
+    with _lock:
+        _disable()
+
+
+def instrumentation_info():
+    """Return the ``StageInfo`` of each stage, by name.
+
+    Returns ``None`` if the instrumentation is not enabled.
+    """
+    with _lock:
+        if _stats is None:
+            return None
+        return {
+            stage: StageInfo(calls, hits, total / 1e9, longest / 1e9)
+            for stage, (calls, hits, total, longest) in _stats.items()
+        }
+
+
+def instrumentation_clear():
+    """Clear the statistics of the instrumentation."""
+    with _lock:
+        if _stats is not None:
+            for stats in _stats.values():
+                stats[:] = [0, 0, 0, 0]
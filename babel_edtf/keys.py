@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Integer sort keys of EDTF level 0 values.
+
+The sort key of a value packs the proleptic Gregorian ordinals (see
+``date.toordinal()``) of its strict lower and upper bounds, and the code of
+its precision (0 for year, 1 for month, 2 for day) in one integer::
+
+    key = lower << 24 | upper << 2 | precision
+
+Keys thus sort by lower bound, then upper bound, then precision, and values
+starting on or after a date ``d`` have keys ``>= d.toordinal() << 24``:
+
+>>> from datetime import date
+>>> from babel_edtf.keys import edtf_sort_keys
+>>> keys = sorted(edtf_sort_keys(["2021", "2020-09/2021", "2020-09-30"]))
+>>> [key >> 24 for key in keys] == [
+...     date(2020, 9, 1).toordinal(),
+...     date(2020, 9, 30).toordinal(),
+...     date(2021, 1, 1).toordinal(),
+... ]
+True
+
+The ordinals of years before 1 are zero or negative (e.g. 0 for 0000-12-31).
+The upper bound is packed without a sign, so only values ending after year 0
+have sort keys.
+"""
+
+from array import array
+from datetime import date
+
+from edtf import Date, DateAndTime, Interval
+
+from . import BOUND_LOWER, BOUND_UPPER, EDTFValueError
+from .bounds import _level0_bound
+from .compact import CompactDate, CompactInterval, _compact_date
+from .parsing import _match_level0
+
+
+def _compact(value):
+    """Return the ``CompactDate`` or ``CompactInterval`` of a level 0 value."""
+    cls = type(value)
+    if cls is CompactDate or cls is CompactInterval:
+        return value
+    elif cls is Date:
+        return CompactDate.from_edtf(value)
+    elif cls is Interval:
+        return CompactInterval.from_edtf(value)
+    elif cls is DateAndTime:
+        return CompactDate.from_edtf(value.date)
+
+    match = _match_level0(value) if isinstance(value, str) else None
+    if match is None:
+        raise EDTFValueError("Only an EDTF level 0 date, date and time or interval.")
+    lower, upper, _ = match
+    if upper is None:
+        return _compact_date(lower)
+    return CompactInterval(_compact_date(lower), _compact_date(upper))
+
+
+# The number of days of 400 years of the proleptic Gregorian calendar.
+_DAYS_IN_400_YEARS = 146097
+
+
+def _ordinal(year, month, day):
+    """Return the ordinal of a date, like ``date.toordinal()`` for any year."""
+    if year > 0:
+        return date(year, month, day).toordinal()
+    cycles = -year // 400 + 1
+    return date(year + cycles * 400, month, day).toordinal() - (
+        cycles * _DAYS_IN_400_YEARS
+    )
+
+
+def edtf_ordinals(value):
+    """Return the ordinals of the bounds and the precision of a level 0 value.
+
+    The bounds are the ones of ``edtf_to_datetime()`` with ``BOUND_LOWER``
+    and ``BOUND_UPPER``, as ``toordinal()`` of their date, also for the
+    years before 1 which ``date`` doesn't support.
+
+    :param value: an EDTF level 0 string, or a Date, DateAndTime, Interval,
+        ``CompactDate`` or ``CompactInterval``.
+    :returns: a tuple ``(lower, upper, precision)`` of integers, where
+        ``precision`` is 0 for year, 1 for month and 2 for day.
+    """
+    compact = _compact(value)
+    return (
+        _ordinal(*_level0_bound(compact, BOUND_LOWER)),
+        _ordinal(*_level0_bound(compact, BOUND_UPPER)),
+        compact.precision_code,
+    )
+
+
+def edtf_sort_key(value):
+    """Return the integer sort key of a level 0 value.
+
+    See ``edtf_ordinals()`` for the values, and the module for the key.
+    Raises ``EDTFValueError`` for values ending before year 1.
+    """
+    lower, upper, precision = edtf_ordinals(value)
+    if upper < 1:
+        raise EDTFValueError("Only values ending after year 0 have sort keys.")
+    return lower << 24 | upper << 2 | precision
+
+
+def edtf_sort_keys(values):
+    """Return the integer sort keys of many level 0 values.
+
+    Identical strings are converted only once.
+
+    :param values: an iterable of values, see ``edtf_ordinals()``.
+    :returns: an ``array("q")`` of the sort keys, in the order of ``values``.
+    """
+    keys = {}
+    result = array("q")
+    for value in values:
+        if isinstance(value, str):
+            key = keys.get(value)
+            if key is None:
+                key = keys[value] = edtf_sort_key(value)
+        else:
+            key = edtf_sort_key(value)
+        result.append(key)
+    return result
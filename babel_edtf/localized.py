@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Parsing of localized dates and intervals into EDTF level 0 strings.
+
+This is the inverse of ``format_edtf()``: the dates and intervals are matched
+with regular expressions derived from the same patterns ``format_edtf()``
+formats with, for all the formats and precisions of ``DATE_SKELETON_FORMATS``,
+and the month, weekday and era names of the locale:
+
+>>> from babel_edtf import parse_localized
+>>> parse_localized("Sep 2020", locale="en")
+'2020-09'
+>>> parse_localized("30. september 2020", locale="da")
+'2020-09-30'
+>>> parse_localized("jan.–sep. 2020", locale="da")
+'2020-01/2020-09'
+"""
+
+import re
+from datetime import date as date_
+from functools import lru_cache
+
+from babel.dates import LC_TIME, get_date_format, parse_pattern, tokenize_pattern
+from edtf.parser.parser_classes import PRECISION_DAY, PRECISION_MONTH, PRECISION_YEAR
+
+from . import EDTFValueError
+from .formatting import _get_date_pattern, _get_interval_skeleton, _get_locale
+from .parsing import _check_level0_date
+
+_formats = ("full", "long", "medium", "short")
+
+# The precisions to match, from the most to the least specific.
+_precisions = (PRECISION_DAY, PRECISION_MONTH, PRECISION_YEAR)
+
+# Dashes separating intervals (but not the hyphens of e.g. "y-MM-dd"), which
+# are matched as any dash.
+_dashes = "‒–—−"
+_dash_pattern = re.compile(rf"(\s*[{_dashes}]\s*)")
+
+
+def _name(name):
+    """Normalize a month, weekday or era name for lookups."""
+    return name.lower().rstrip(".")
+
+
+def _alternation(names):
+    """Return a regular expression matching any of the names."""
+    return "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+
+
+class _Matchers:
+    """The compiled regular expressions of the patterns of a locale."""
+
+    def __init__(self, locale):
+        """Derive the regular expressions from the patterns of a locale."""
+        # Narrow names are left out, as they are ambiguous.
+        self.months = {}
+        for context in ("format", "stand-alone"):
+            for width in ("abbreviated", "wide"):
+                for key, value in locale.months[context][width].items():
+                    self.months.setdefault(_name(value), key)
+        self.days = {}
+        for context in ("format", "stand-alone"):
+            for width in ("abbreviated", "short", "wide"):
+                for key, value in locale.days[context][width].items():
+                    self.days.setdefault(_name(value), key)
+        eras = {_name(locale.eras[width][1]) for width in ("abbreviated", "wide")}
+
+        self._fields = {
+            "months": _alternation(self.months),
+            "days": _alternation(self.days),
+            "eras": _alternation(eras),
+        }
+
+        # The regular expressions, and whether they match intervals.
+        sources = {}
+        for precision in _precisions:
+            for format in _formats:
+                pattern = _get_date_pattern(locale, format, precision)
+                sources.setdefault(self._regex(pattern), False)
+
+        fallback = locale.interval_formats.get(None, "{0}-{1}")
+        start, _, rest = fallback.partition("{0}")
+        middle, _, end = rest.partition("{1}")
+        for precision in _precisions:
+            for format in _formats:
+                skeleton = _get_interval_skeleton(locale, format, precision)
+                if skeleton is not None and skeleton in locale.interval_formats:
+                    for field, parts in locale.interval_formats[skeleton].items():
+                        if field in ("y", "M", "d") and len(parts) == 2:
+                            lower = self._regex(parts[0], "s_")
+                            upper = self._regex(parts[1], "e_")
+                            if lower is not None and upper is not None:
+                                sources.setdefault(lower + upper, True)
+
+                # See babel.dates._format_fallback_interval()
+                pattern = locale.datetime_skeletons.get(skeleton) or get_date_format(
+                    "medium", locale=locale
+                )
+                lower = self._regex(pattern, "s_")
+                upper = self._regex(pattern, "e_")
+                if lower is not None and upper is not None:
+                    source = (
+                        _chars(start) + lower + _chars(middle) + upper + _chars(end)
+                    )
+                    sources.setdefault(source, True)
+
+        sources.pop(None, None)
+        self.regexes = [
+            (re.compile(source, re.IGNORECASE), interval)
+            for source, interval in sources.items()
+        ]
+
+    def _regex(self, pattern, prefix=""):
+        """Return the regular expression of a date pattern.
+
+        Returns ``None`` if the pattern has fields which can't be parsed.
+        """
+        regex = []
+        for kind, value in tokenize_pattern(parse_pattern(pattern).pattern):
+            if kind == "chars":
+                regex.append(_chars(value))
+                continue
+
+            field, count = value
+            if field in "yY":
+                # Only "yy" formats years with less than three digits.
+                if count == 2:
+                    regex.append(rf"(?P<{prefix}yy>\d{{2}})")
+                else:
+                    regex.append(rf"(?P<{prefix}y>\d{{3,4}})")
+            elif field in "ML" and count <= 2:
+                regex.append(rf"(?P<{prefix}M>\d{{1,2}})")
+            elif field in "ML" and count <= 4:
+                regex.append(rf"(?P<{prefix}MMM>{self._fields['months']})\.?")
+            elif field == "d":
+                regex.append(rf"(?P<{prefix}d>\d{{1,2}})")
+            elif field in "Ec" and count != 5:
+                regex.append(rf"(?P<{prefix}E>{self._fields['days']})\.?")
+            elif field == "G":
+                regex.append(rf"(?:{self._fields['eras']})\.?")
+            else:
+                return None
+        return "".join(regex)
+
+    def _date(self, groups, prefix):
+        """Return the ``[year, month, day, weekday]`` of a matched date."""
+        year = groups.get(prefix + "y")
+        if year is not None:
+            year = int(year)
+        elif groups.get(prefix + "yy") is not None:
+            year = _expand_year(int(groups[prefix + "yy"]))
+
+        month = groups.get(prefix + "M")
+        if month is not None:
+            month = int(month)
+        elif groups.get(prefix + "MMM") is not None:
+            month = self.months[_name(groups[prefix + "MMM"])]
+
+        day = groups.get(prefix + "d")
+        if day is not None:
+            day = int(day)
+
+        weekday = groups.get(prefix + "E")
+        if weekday is not None:
+            weekday = self.days[_name(weekday)]
+
+        return [year, month, day, weekday]
+
+    def parse(self, text):
+        """Return the EDTF string of a localized date or interval."""
+        text = text.strip()
+        error = None
+        for regex, interval in self.regexes:
+            match = regex.fullmatch(text)
+            if match is None:
+                continue
+            groups = match.groupdict()
+            try:
+                if not interval:
+                    return _edtf_date(*self._date(groups, ""))
+
+                # The year, month or day which are only in one of the parts
+                # are shared.
+                lower = self._date(groups, "s_")
+                upper = self._date(groups, "e_")
+                for i in range(3):
+                    if lower[i] is None:
+                        lower[i] = upper[i]
+                    elif upper[i] is None:
+                        upper[i] = lower[i]
+                return f"{_edtf_date(*lower)}/{_edtf_date(*upper)}"
+            except EDTFValueError as e:
+                error = e  # Another pattern may match with valid fields.
+
+        raise error or EDTFValueError(
+            f"The text {text!r} is not a date or interval of the locale."
+        )
+
+
+def _chars(chars):
+    """Return the regular expression of the literal text of a pattern."""
+    # Commas can be left out if they are followed by a space, which still
+    # separates e.g. the day from the year.
+    optional_comma = any(char.isspace() for char in chars)
+    regex = []
+    for i, part in enumerate(_dash_pattern.split(chars)):
+        if i % 2:  # A dash, matched with or without spaces around it.
+            regex.append(rf"\s*[-{_dashes}]\s*")
+            continue
+        for char in part:
+            if char.isspace():
+                if not regex or regex[-1] != r"\s+":
+                    regex.append(r"\s+")
+            elif char == "," and optional_comma:
+                regex.append(",?")
+            else:
+                regex.append(re.escape(char))
+    return "".join(regex)
+
+
+def _expand_year(year):
+    """Expand a two-digit year to the century closest to today.
+
+    Like in CLDR, the year is within 80 years before and 20 years after
+    the current year.
+    """
+    start = date_.today().year - 80
+    year += start // 100 * 100
+    if year < start:
+        year += 100
+    return year
+
+
+def _edtf_date(year, month, day, weekday):
+    """Return the EDTF string of the fields of a matched date."""
+    fields = [
+        f"{year:04d}",
+        None if month is None else f"{month:02d}",
+        None if day is None else f"{day:02d}",
+    ]
+    if _check_level0_date(*fields) is not None:
+        raise EDTFValueError("The date is out of range.")
+    if (
+        weekday is not None
+        and year > 0
+        and date_(year, month, day).weekday() != weekday
+    ):
+        raise EDTFValueError("The day of the week doesn't match the date.")
+    return "-".join(f for f in fields if f is not None)
+
+
+@lru_cache(maxsize=256)
+def _get_matchers(locale):
+    """Return the (cached) ``_Matchers`` of a locale."""
+    return _Matchers(locale)
+
+
+def parse_localized(text, locale=LC_TIME):
+    """Parse a localized date or interval into an EDTF level 0 string.
+
+    This parses what ``format_edtf()`` formats in any of the "full", "long",
+    "medium" and "short" formats. Month and weekday names are matched
+    regardless of their case, and with or without their abbreviation dot.
+    Any spaces separate the fields, commas can be left out, and any dash
+    separates intervals.
+    Two-digit years are within 80 years before and 20 years after today, and
+    years before 100 can't be parsed.
+
+    :param text: the localized date or interval.
+    :param locale: a `Locale` object or a locale identifier
+    :returns: the EDTF level 0 string, e.g. "2020-09" for "Sep 2020" in
+        English.
+    """
+    return _get_matchers(_get_locale(locale)).parse(text)
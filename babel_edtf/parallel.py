@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Formatting of many EDTF values with a pool of processes."""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .formatting import format_edtf, load_pattern_tables, warm_up
+
+
+def _init_worker(locales, formats, pattern_tables):
+    """Load the pattern tables, if any, and warm up a worker."""
+    if pattern_tables is not None:
+        load_pattern_tables(pattern_tables)
+    warm_up(locales, formats)
+
+
+def _format_chunk(chunk):
+    """Format a chunk of ``(value, locale, format)`` tuples in a worker."""
+    return [format_edtf(value, format, locale) for value, locale, format in chunk]
+
+
+def _chunked(iterable, size):
+    """Split an iterable into lists of ``size`` items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def format_edtf_parallel(
+    items,
+    max_workers=None,
+    chunksize=1000,
+    locales=(),
+    formats=("full", "long", "medium", "short"),
+    pattern_tables=None,
+):
+    """Format ``(value, locale, format)`` tuples with a pool of processes.
+
+    The items are sent to the worker processes in chunks, and only a few
+    chunks per worker are in flight at any time, so that ``items`` can be an
+    arbitrarily long iterator.
+
+    :param items: an iterable of ``(value, locale, format)`` tuples, with the
+        same meaning as the arguments of ``format_edtf()``.
+    :param max_workers: the number of worker processes (defaults to the
+        number of CPUs).
+    :param chunksize: the number of items sent to a worker at once.
+    :param locales: locales to resolve in each worker before formatting, for
+        each of the ``formats``.
+    :param formats: the formats to resolve for each of the ``locales``.
+    :param pattern_tables: the path of a file saved with
+        ``save_pattern_tables()``, that each worker loads at startup.
+    :returns: an iterator over the formatted values, in the order of
+        ``items``.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers,
+        initializer=_init_worker,
+        initargs=(locales, formats, pattern_tables),
+    ) as executor:
+        pending = deque()
+        for chunk in _chunked(items, chunksize):
+            pending.append(executor.submit(_format_chunk, chunk))
+            if len(pending) > 2 * max_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
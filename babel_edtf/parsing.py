@@ -0,0 +1,379 @@
+# SPDX-FileCopyrightText: 2020-2024 CERN.
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Parsing of Extended Date Time Format (EDTF) strings."""
+
+import calendar
+import re
+import threading
+from copy import deepcopy
+from datetime import timedelta, timezone
+from functools import lru_cache
+
+from edtf import Date, DateAndTime, Interval
+from edtf import parse_edtf as edtf_parse_edtf
+from edtf.parser.grammar import EDTFParseException, ParseException
+from edtf.parser.parser_classes import PRECISION_DAY, Level1Interval
+
+from . import EDTFValueError
+
+# Compiled patterns for the level 0 productions of the EDTF grammar (see
+# ``edtf.parser.grammar``). Ranges are kept as loose as possible here, and
+# months and days are range checked in ``_match_level0_date()``. Like the
+# grammar, only ASCII digits are matched.
+_level0_date_pattern = re.compile(r"(-?\d{4})(?:-(\d{2})(?:-(\d{2}))?)?", re.ASCII)
+_level0_time_pattern = re.compile(
+    r"(?:(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d|24:00:00)"
+    r"(?:Z|[+-](?:(?:0[1-9]|1[0-3])(?::[0-5]\d)?|14:00|00:(?:0[1-9]|[1-5]\d)))?",
+    re.ASCII,
+)
+# Like the grammar, allow up to 29 days for February regardless of the year.
+_level0_max_days = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Reasons why a string is not a valid level 0 expression, see
+# ``validate_many()``.
+INVALID_SYNTAX = "syntax"
+INVALID_MONTH = "month"
+INVALID_DAY = "day"
+INVALID_LEAP_DAY = "leap_day"
+
+# Lock serializing the use of python-edtf's grammar, see ``_parse_edtf()``.
+_grammar_lock = threading.Lock()
+
+
+def parse_edtf_level0(edtfstr):
+    """Parse EDTF input string."""
+    try:
+        return parse_edtf(edtfstr)
+    except ParseException:
+        raise EDTFValueError("The string is not a valid EDTF-formatted string.")
+
+
+def _validate_leap_year(edtf_date):
+    """Validate that dates on the 29th of February are on leap years."""
+    if isinstance(edtf_date, Interval):
+        dates = (edtf_date.lower, edtf_date.upper)
+    else:
+        dates = (edtf_date,)
+    for date in dates:
+        if (
+            isinstance(date, Date)
+            and date.precision == PRECISION_DAY
+            and date.day == "29"
+            and date.month == "02"
+            and not calendar.isleap(int(date.year))
+        ):
+            raise EDTFParseException(
+                "Day is out of range for month of February on non-leap year."
+            )
+
+
+def _check_level0_date(year, month, day):
+    """Range check the fields of a level 0 date.
+
+    Returns the reason why the date is invalid, or ``None`` if it is valid.
+    """
+    if year == "-0000":
+        return INVALID_SYNTAX
+    if month is not None:
+        m = int(month)
+        if not 1 <= m <= 12:
+            return INVALID_MONTH
+        if day is not None:
+            d = int(day)
+            if not 1 <= d <= _level0_max_days[m - 1]:
+                return INVALID_DAY
+            if m == 2 and d == 29 and not calendar.isleap(int(year)):
+                return INVALID_LEAP_DAY
+    return None
+
+
+def _match_level0_date(datestr):
+    """Match a level 0 date string, without using the grammar.
+
+    Returns the ``(year, month, day)`` strings of the date (``month`` and
+    ``day`` may be ``None``), or ``None`` if the string is not a valid level 0
+    date, or if it is a 29th of February on a non-leap year (which is left for
+    the grammar and ``_validate_leap_year()`` to report).
+    """
+    match = _level0_date_pattern.fullmatch(datestr)
+    if match is None:
+        return None
+
+    fields = match.groups()
+    if _check_level0_date(*fields) is not None:
+        return None
+    return fields
+
+
+def _match_level0(edtfstr):
+    """Match a level 0 date, date and time, or interval without the grammar.
+
+    Returns a tuple ``(lower, upper, time)``, where ``lower`` and ``upper``
+    are the ``(year, month, day)`` of the interval bounds, or ``lower`` is the
+    date and ``upper`` is ``None``. ``time`` is the time of a date and time,
+    or ``None``. Returns ``None`` for anything which is not a plain level 0
+    expression.
+    """
+    lower, sep, upper = edtfstr.partition("/")
+    if sep:
+        lower = _match_level0_date(lower)
+        if lower is None:
+            return None
+        upper = _match_level0_date(upper)
+        if upper is None:
+            return None
+        return lower, upper, None
+
+    datestr, sep, timestr = edtfstr.partition("T")
+    if sep:
+        if _level0_time_pattern.fullmatch(timestr) is None:
+            return None
+        date = _match_level0_date(datestr)
+        if date is None:
+            return None
+        return date, None, timestr
+
+    date = _match_level0_date(edtfstr)
+    if date is None:
+        return None
+    return date, None, None
+
+
+@lru_cache(maxsize=4096)
+def _parse_level0_time(timestr):
+    """Parse the time of a level 0 date and time, e.g. "23:20:30+04:30".
+
+    Returns a tuple ``(hour, minute, second, tzinfo)``, where ``tzinfo`` is
+    ``None`` for local times (without an offset). The hour is ``24`` for
+    "24:00:00", the end of the day. Times are cached, as the same times (e.g.
+    "00:00:00Z") are common.
+    """
+    if not isinstance(timestr, str) or _level0_time_pattern.fullmatch(timestr) is None:
+        raise EDTFValueError("The string is not a valid EDTF level 0 time.")
+
+    hour, minute, second = int(timestr[0:2]), int(timestr[3:5]), int(timestr[6:8])
+    offset = timestr[8:]
+    if not offset:
+        tzinfo = None
+    elif offset == "Z":
+        tzinfo = timezone.utc
+    else:
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6] or 0))
+        tzinfo = timezone(-delta if offset[0] == "-" else delta)
+    return hour, minute, second, tzinfo
+
+
+def _level0_error(edtfstr):
+    """Return why a string is not a level 0 expression, or ``None``.
+
+    This checks the same as ``_match_level0()``, but reports the reason.
+    """
+    if not isinstance(edtfstr, str):
+        return INVALID_SYNTAX
+
+    lower, sep, upper = edtfstr.partition("/")
+    if sep:
+        dates = (lower, upper)
+    else:
+        datestr, sep, timestr = edtfstr.partition("T")
+        if sep and _level0_time_pattern.fullmatch(timestr) is None:
+            return INVALID_SYNTAX
+        dates = (datestr,)
+
+    for datestr in dates:
+        match = _level0_date_pattern.fullmatch(datestr)
+        if match is None:
+            return INVALID_SYNTAX
+        error = _check_level0_date(*match.groups())
+        if error is not None:
+            return error
+    return None
+
+
+def is_valid_edtf_level0(edtfstr):
+    """Return whether a string is a valid EDTF level 0 expression.
+
+    Level 0 dates, dates and times, and intervals are checked like
+    ``parse_edtf_level0()`` does (including the day of month and leap years),
+    but without building EDTF objects or raising exceptions. Level 1 and 2
+    expressions are not valid level 0 expressions.
+    """
+    return _level0_error(edtfstr) is None
+
+
+def validate_many(values):
+    """Validate many EDTF level 0 expressions.
+
+    :param values: an iterable of strings.
+    :returns: a list with ``None`` for the valid values, and the reason why
+        the others are invalid: ``INVALID_SYNTAX`` ("syntax"),
+        ``INVALID_MONTH`` ("month"), ``INVALID_DAY`` ("day") or
+        ``INVALID_LEAP_DAY`` ("leap_day") for a 29th of February on a non-leap
+        year.
+    """
+    return [_level0_error(value) for value in values]
+
+
+def _parse_open_interval(edtfstr):
+    """Parse an interval of a level 0 date and an open or unknown end.
+
+    These are level 1 intervals (e.g. "2020/.." or "/2020"), built like the
+    grammar does. Returns ``None`` for anything else.
+    """
+    lower, sep, upper = edtfstr.partition("/")
+    if not sep:
+        return None
+    elif upper == ".." or upper == "":
+        date = _match_level0_date(lower)
+        if date is None:
+            return None
+        return Level1Interval(
+            {"date": Date(*date), "ua": None}, {"date": upper} if upper else None
+        )
+    elif lower == ".." or lower == "":
+        date = _match_level0_date(upper)
+        if date is None:
+            return None
+        return Level1Interval(
+            {"date": lower} if lower else None, {"date": Date(*date), "ua": None}
+        )
+    return None
+
+
+def _parse_level0(edtfstr):
+    """Parse a level 0 date, date and time, or interval without the grammar.
+
+    Intervals of a level 0 date and an open or unknown end are parsed too.
+    Returns ``None`` for anything else, in which case the caller must fall
+    back to python-edtf's grammar. The returned objects are identical to the
+    ones built by the grammar.
+    """
+    match = _match_level0(edtfstr)
+    if match is None:
+        return _parse_open_interval(edtfstr)
+
+    lower, upper, timestr = match
+    if upper is not None:
+        return Interval(Date(*lower), Date(*upper))
+    elif timestr is not None:
+        return DateAndTime(Date(*lower), timestr)
+    return Date(*lower)
+
+
+def _parse_edtf(date):
+    """parse_edtf after trying a compiled parser for EDTF level 0 expressions.
+
+    All level 0 dates, dates and times, and intervals (and intervals with an
+    open or unknown end) are parsed without python-edtf's pyparsing grammar,
+    which is slow and doesn't work in a thread safe way (it throws TypeError
+    randomly on some runs). Anything else (level 1 and 2 expressions, and
+    invalid strings) falls back to python-edtf's parse_edtf, one thread at a
+    time.
+    """
+    edtf_date = _parse_level0(date)
+    if edtf_date is not None:
+        return edtf_date
+
+    # pyparsing's packrat cache is shared by all threads, so per-thread
+    # grammars would not help. Only let one thread use the grammar at a time.
+    with _grammar_lock:
+        edtf_date = edtf_parse_edtf(date)
+
+    # python-edtf's edtf_parse_edtf uses a grammar that allows days up to 29
+    # for the month of February regardless of whether the year is a leap year
+    # or not. Here we fail in case we hit this corner case.
+    _validate_leap_year(edtf_date)
+
+    return edtf_date
+
+
+_parse_cache = None
+
+
+def _copy_edtf(edtf_date):
+    """Copy a parsed EDTF object so that cached objects can't be modified.
+
+    Level 0 objects are rebuilt directly as this is much cheaper than a deep
+    copy.
+    """
+    cls = type(edtf_date)
+    if cls is Date:
+        return Date(
+            edtf_date.year,
+            edtf_date.month,
+            edtf_date.day,
+            edtf_date.significant_digits,
+        )
+    elif cls is Interval:
+        return Interval(_copy_edtf(edtf_date.lower), _copy_edtf(edtf_date.upper))
+    elif cls is DateAndTime:
+        return DateAndTime(_copy_edtf(edtf_date.date), edtf_date.time)
+    return deepcopy(edtf_date)
+
+
+def enable_parse_cache(maxsize=4096):
+    """Enable a least-recently-used cache of parsed EDTF strings.
+
+    The cache is disabled by default. Once enabled, ``parse_edtf()`` and
+    ``parse_edtf_level0()`` return a copy of the cached object for strings
+    that were parsed before. Invalid strings are not cached.
+
+    :param maxsize: the maximum number of cached strings.
+    """
+    global _parse_cache
+    _parse_cache = lru_cache(maxsize=maxsize)(_parse_edtf)
+
+
+def disable_parse_cache():
+    """Disable and drop the cache of parsed EDTF strings."""
+    global _parse_cache
+    _parse_cache = None
+
+
+def parse_cache_info():
+    """Return the hits, misses, maxsize and currsize of the parse cache.
+
+    Returns ``None`` if the cache is not enabled.
+    """
+    if _parse_cache is None:
+        return None
+    return _parse_cache.cache_info()
+
+
+def parse_cache_clear():
+    """Clear the cache of parsed EDTF strings and its statistics."""
+    if _parse_cache is not None:
+        _parse_cache.cache_clear()
+
+
+def parse_edtf_many(dates):
+    """Parse many EDTF strings, parsing identical strings only once.
+
+    Identical strings give equal but distinct objects, so that modifying one
+    of the results doesn't modify the others.
+
+    :param dates: an iterable of EDTF strings.
+    :returns: a list of the parsed values, in the order of ``dates``.
+    """
+    parsed = {}
+    result = []
+    for date in dates:
+        edtf_date = parsed.get(date)
+        if edtf_date is None:
+            edtf_date = parsed[date] = parse_edtf(date)
+        else:
+            edtf_date = _copy_edtf(edtf_date)
+        result.append(edtf_date)
+    return result
+
+
+def parse_edtf(date):
+    """Parse an EDTF string, using the parse cache if it is enabled.
+
+    See ``_parse_edtf()`` for the parsing itself.
+    """
+    if _parse_cache is None:
+        return _parse_edtf(date)
+    return _copy_edtf(_parse_cache(date))
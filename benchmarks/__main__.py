@@ -0,0 +1,316 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Benchmarks of the parse and format hot paths of Babel-EDTF.
+
+Run from the root of the repository:
+
+.. code-block:: console
+
+   $ python -m benchmarks              # compare with the stored baseline
+   $ python -m benchmarks --save       # store a new baseline
+   $ python -m benchmarks -k format/   # only run some benchmarks
+
+The throughput of each benchmark is compared with ``baseline.json``, and the
+run fails if it is more than ``--threshold`` slower. The peak memory allocated
+while processing the corpus once is reported as well. The ``import/``
+benchmarks measure imports per second of the package in a fresh interpreter,
+and the ``memory/`` benchmarks the peak memory of keeping all parsed values.
+Timings depend on the machine, so store a baseline on the machine you compare
+on.
+"""
+
+import argparse
+import calendar
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from babel_edtf import (
+    EDTFIndex,
+    LRUCache,
+    SQLiteCache,
+    disable_format_cache,
+    edtf_histogram,
+    edtf_sort_keys,
+    enable_format_cache,
+    format_edtf,
+    parse_edtf,
+    parse_edtf_compact,
+    parse_localized,
+    validate_many,
+)
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+LOCALES = ["en", "da", "de", "fr", "ja"]
+FORMATS = ["short", "medium", "long", "full"]
+
+# Statements whose import time is measured in a fresh interpreter.
+IMPORTS = {
+    "import/package": "import babel_edtf; babel_edtf.BOUND_LOWER",
+    "import/parse_edtf": "from babel_edtf import parse_edtf",
+    "import/format_edtf": "from babel_edtf import format_edtf",
+}
+
+
+def corpora(size=200, seed=20201106):
+    """Return realistic corpora of EDTF strings, by kind."""
+    rng = random.Random(seed)
+
+    def year():
+        return str(rng.randint(1000, 2100))
+
+    def month():
+        return f"{year()}-{rng.randint(1, 12):02d}"
+
+    def day():
+        y, m = rng.randint(1000, 2100), rng.randint(1, 12)
+        return f"{y}-{m:02d}-{rng.randint(1, calendar.monthrange(y, m)[1]):02d}"
+
+    def datetime():
+        time = f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00"
+        return f"{day()}T{time}{rng.choice(['', 'Z', '+01:00', '-05'])}"
+
+    def interval(lower, upper):
+        bounds = sorted([lower(), upper()])
+        return "/".join(bounds)
+
+    kinds = [year, month, day]
+    return {
+        "year": [year() for _ in range(size)],
+        "month": [month() for _ in range(size)],
+        "day": [day() for _ in range(size)],
+        "datetime": [datetime() for _ in range(size)],
+        "interval": [interval(k, k) for k in rng.choices(kinds, k=size)],
+        "interval-mixed": [interval(*rng.sample(kinds, 2)) for _ in range(size)],
+        "invalid": [
+            rng.choice(["2021-02-29", "2020-13", "31-12-2020", "2020?", "abc"])
+            for _ in range(size)
+        ],
+        "interval-open": [
+            rng.choice(["{}/..", "{}/", "../{}", "/{}"]).format(rng.choice(kinds)())
+            for _ in range(size)
+        ],
+    }
+
+
+def _parse(values):
+    for value in values:
+        try:
+            parse_edtf(value)
+        except Exception:  # Invalid strings are part of the benchmarks.
+            pass
+
+
+def _keep(parse):
+    def run(values):
+        return [parse(value) for value in values]
+
+    return run
+
+
+def _build_index(values):
+    return EDTFIndex(enumerate(values))
+
+
+def _query_index(values, query):
+    index = _build_index(values)
+
+    def run(queries):
+        for value in queries:
+            query(index, value)
+
+    return run
+
+
+def _histogram(granularity):
+    def run(values):
+        edtf_histogram(values, granularity, locale="en")
+
+    return run
+
+
+def _parse_localized(locale):
+    def run(texts):
+        for text in texts:
+            parse_localized(text, locale)
+
+    return run
+
+
+def _format(locale, format):
+    def run(values):
+        for value in values:
+            try:
+                format_edtf(value, format=format, locale=locale)
+            except Exception:  # Invalid strings are part of the benchmarks.
+                pass
+
+    return run
+
+
+def _format_cached(cache):
+    def run(values):
+        enable_format_cache(cache)
+        try:
+            for value in values:
+                format_edtf(value, locale="en")
+        finally:
+            disable_format_cache()
+
+    return run
+
+
+def benchmarks():
+    """Yield the ``(name, function, values)`` of all benchmarks."""
+    corpus = corpora()
+    for kind, values in corpus.items():
+        yield f"parse/{kind}", _parse, values
+    for kind, values in corpus.items():
+        yield f"validate/{kind}", validate_many, values
+    for kind in ["year", "month", "day", "datetime", "interval", "interval-mixed"]:
+        yield f"keys/{kind}", edtf_sort_keys, corpus[kind]
+    # An index of all the level 0 values, queried with the intervals.
+    indexed = [
+        value
+        for kind in ["year", "month", "day", "datetime", "interval", "interval-mixed"]
+        for value in corpus[kind]
+    ]
+    yield "index/build", _build_index, indexed
+    for query in [EDTFIndex.overlapping, EDTFIndex.within, EDTFIndex.containing]:
+        yield f"index/{query.__name__}", _query_index(indexed, query), corpus[
+            "interval"
+        ]
+    for granularity in ["century", "decade", "year", "month"]:
+        yield f"histogram/{granularity}", _histogram(granularity), indexed
+    # The peak memory of keeping the parsed corpus, e.g. to sort or index it.
+    for kind in ["year", "day", "interval"]:
+        yield f"memory/parse/{kind}", _keep(parse_edtf), corpus[kind]
+        yield f"memory/compact/{kind}", _keep(parse_edtf_compact), corpus[kind]
+    for kind in [
+        "year",
+        "month",
+        "day",
+        "datetime",
+        "interval",
+        "interval-mixed",
+        "interval-open",
+    ]:
+        for locale in LOCALES:
+            for format in FORMATS:
+                yield f"format/{kind}/{locale}/{format}", _format(
+                    locale, format
+                ), corpus[kind]
+    yield "format/invalid", _format("en", "medium"), corpus["invalid"]
+    # Formatting with cache hits, after the first run.
+    database = Path(tempfile.gettempdir()) / "babel-edtf-benchmarks.db"
+    for name, cache in [("lru", LRUCache()), ("sqlite", SQLiteCache(database))]:
+        yield f"format-cache/{name}", _format_cached(cache), corpus["interval"]
+    for locale in LOCALES:
+        texts = [
+            format_edtf(value, format, locale)
+            for kind in ["year", "month", "day", "interval"]
+            for value, format in zip(corpus[kind][:50], FORMATS * 13)
+        ]
+        yield f"localized/{locale}", _parse_localized(locale), texts
+    for name, statement in IMPORTS.items():
+        yield name, None, statement
+
+
+def measure(func, values, min_time, repeat):
+    """Return the throughput and peak memory of running func over values."""
+    func(values)  # Warm up the caches.
+    best = float("inf")
+    for _ in range(repeat):
+        runs = 0
+        start = time.perf_counter()
+        while True:
+            func(values)
+            runs += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / (runs * len(values)))
+
+    tracemalloc.start()
+    func(values)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"ops": round(1 / best), "peak_kib": round(peak / 1024, 1)}
+
+
+def _run_import(statement, trace=False):
+    code = (
+        "import time, tracemalloc\n"
+        f"{'tracemalloc.start()' if trace else ''}\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start, tracemalloc.get_traced_memory()[1])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return [float(v) for v in result.stdout.split()]
+
+
+def measure_import(statement, repeat):
+    """Return the imports per second and peak memory of an import statement."""
+    best = min(_run_import(statement)[0] for _ in range(repeat))
+    peak = _run_import(statement, trace=True)[1]
+    return {"ops": round(1 / best, 1), "peak_kib": round(peak / 1024, 1)}
+
+
+def main(argv=None):
+    """Run the benchmarks and compare them with the baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="filter", default="", help="name filter")
+    parser.add_argument("--save", action="store_true", help="store a baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    results = {}
+    regressions = []
+    print(f"{'benchmark':<34} {'ops/s':>10} {'baseline':>9} {'peak KiB':>9}")
+    for name, func, values in benchmarks():
+        if args.filter not in name:
+            continue
+        if func is None:
+            result = measure_import(values, args.repeat)
+        else:
+            result = measure(func, values, args.min_time, args.repeat)
+        results[name] = result
+        change = ""
+        if name in baseline:
+            ratio = result["ops"] / baseline[name]["ops"]
+            change = f"{ratio - 1:+.0%}"
+            if ratio < 1 - args.threshold:
+                regressions.append(name)
+        print(f"{name:<34} {result['ops']:>10} {change:>9} {result['peak_kib']:>9}")
+
+    if args.save:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+    elif regressions:
+        print(
+            f"\n{len(regressions)} benchmark(s) more than {args.threshold:.0%} slower"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Asyncio formatting tests."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from babel_edtf import (
+    EDTFValueError,
+    aformat_edtf,
+    aformat_edtf_many,
+    format_edtf,
+)
+
+values = ["2020", "2020-09", "2020-09-30", "2020-09/2021-11", "2020/2021"] * 4
+
+
+def test_aformat_edtf():
+    """Test formatting a value gives the same as format_edtf."""
+    result = asyncio.run(aformat_edtf("2020-09/2021-11", "long", "da"))
+    assert result == format_edtf("2020-09/2021-11", "long", "da")
+
+
+@pytest.mark.parametrize("chunksize", [100, 3])
+def test_aformat_edtf_many(chunksize):
+    """Test formatting inline or in chunks keeps the values and their order."""
+    expected = [format_edtf(v, "short", "de") for v in values]
+    result = asyncio.run(
+        aformat_edtf_many(iter(values), "short", "de", chunksize=chunksize)
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize("executor", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_aformat_edtf_many_executor(executor):
+    """Test formatting the chunks in a given executor."""
+
+    async def run():
+        with executor(2) as pool:
+            return await aformat_edtf_many(values, executor=pool, chunksize=4)
+
+    assert asyncio.run(run()) == [format_edtf(v) for v in values]
+
+
+def test_aformat_edtf_many_yields():
+    """Test other tasks run while a large batch is formatted."""
+    ticks = []
+
+    async def tick():
+        for _ in range(3):
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def run():
+        task = asyncio.create_task(tick())
+        result = await aformat_edtf_many(values * 10, chunksize=10)
+        done = len(ticks)
+        await task
+        return result, done
+
+    result, done = asyncio.run(run())
+    assert len(result) == len(values) * 10
+    assert done > 0
+
+
+def test_aformat_edtf_many_invalid():
+    """Test invalid values raise the same errors as format_edtf."""
+    with pytest.raises(EDTFValueError):
+        asyncio.run(aformat_edtf_many(values + ["2020-13"], chunksize=4))
+
+
+def test_aformat_edtf_many_errors():
+    """Test invalid values can be returned instead of raised."""
+    result = asyncio.run(
+        aformat_edtf_many(values + ["2020-13"], chunksize=4, errors="return")
+    )
+    assert result[:-1] == [format_edtf(value) for value in values]
+    assert isinstance(result[-1], EDTFValueError)
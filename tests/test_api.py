@@ -3,13 +3,34 @@
 
 """Module tests."""
 
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
+from babel import Locale
+from babel.dates import (
+    format_date,
+    format_datetime,
+    format_interval,
+    format_skeleton,
+    parse_pattern,
+)
 from edtf import Date, DateAndTime, Interval
+from edtf import parse_edtf as edtf_parse_edtf
 from edtf.parser.edtf_exceptions import EDTFParseException
 
-from babel_edtf import edtf_to_datetime, format_edtf, parse_edtf, parse_edtf_level0
+from babel_edtf import (
+    DATE_SKELETON_FORMATS,
+    EDTFTypeError,
+    EDTFValueError,
+    edtf_to_datetime,
+    format_edtf,
+    format_edtf_many,
+    get_interval_precision,
+    parse_edtf,
+    parse_edtf_level0,
+    parse_edtf_many,
+)
+from babel_edtf.formatting import _compile_pattern
 
 separator = "\u2009–\u2009"
 
@@ -97,16 +118,95 @@ def test_format_edtf_invalid():
     """Test invalid values to format_edtf."""
     pytest.raises(ValueError, format_edtf, "invalid")
 
-    # With version 5.0.0, this is parsed as an interval,
-    # but `interval.lower` is of type `UncertainOrApproximate`,
-    # so the precision cannot be determined for formatting,
-    # hence the `AttributeError`.
-    pytest.raises(AttributeError, format_edtf, "2021/")
+    # Level 1 intervals other than of a level 0 date and an open or unknown
+    # end.
+    pytest.raises(ValueError, format_edtf, "2020~/2021")
+    pytest.raises(ValueError, format_edtf, "2020~/..")
+    pytest.raises(ValueError, format_edtf, "../..")
 
     pytest.raises(ValueError, format_edtf, "2020?")
     pytest.raises(TypeError, format_edtf, 2020)
 
 
+@pytest.mark.parametrize(
+    "edtfstr,locale,format,expected",
+    [
+        ("2021/", "en", "medium", "since 2021"),
+        ("2020-09/..", "en", "medium", "since Sep 2020"),
+        ("../2020-09-30", "en", "long", "until September 30, 2020"),
+        ("/2020-09", "de", "long", "bis September 2020"),
+        ("2020/..", "ja", "medium", "2020年から"),
+        ("2020/..", "de_AT", "medium", "seit 2020"),
+        # Locales without patterns use their fallback interval pattern.
+        ("2020-09/..", "fi", "medium", "syys 2020–"),
+        ("../2020-09-30", "zh", "medium", "– 2020年9月30日"),
+    ],
+)
+def test_format_edtf_open_interval(edtfstr, locale, format, expected):
+    """Test intervals with an open or unknown end."""
+    assert format_edtf(edtfstr, format=format, locale=locale) == expected
+
+
+@pytest.mark.parametrize("locale", ["en", "da", "de", "fr_CA", "ja", "ko", "ar"])
+@pytest.mark.parametrize(
+    "format", ["full", "long", "medium", "short", "yyyy-MM-dd HH:mm:ss zzzz"]
+)
+@pytest.mark.parametrize(
+    "edtfstr,dt",
+    [
+        (
+            "1985-04-12T23:20:30+04:30",
+            datetime(1985, 4, 12, 23, 20, 30, tzinfo=timezone(timedelta(hours=4.5))),
+        ),
+        ("2020-09-30T00:05:00Z", datetime(2020, 9, 30, 0, 5, tzinfo=timezone.utc)),
+        (
+            "2020-09-30T10:05:00-05",
+            datetime(2020, 9, 30, 10, 5, tzinfo=timezone(timedelta(hours=-5))),
+        ),
+    ],
+)
+def test_format_edtf_datetime_babel(edtfstr, dt, format, locale):
+    """Test dates and times with an offset format exactly like Babel."""
+    expected = format_datetime(dt, format, locale=locale)
+    assert format_edtf(edtfstr, format=format, locale=locale) == expected
+
+
+@pytest.mark.parametrize(
+    "edtfstr,locale,format,expected",
+    [
+        # Local times are formatted without a time zone.
+        ("1985-04-12T23:20:30", "en", "short", "4/12/85, 11:20\u202fPM"),
+        (
+            "1985-04-12T23:20:30",
+            "en",
+            "full",
+            "Friday, April 12, 1985, 11:20:30\u202fPM",
+        ),
+        (
+            "1985-04-12T23:20:30",
+            "ko",
+            "full",
+            "1985년 4월 12일 금요일 PM 11시 20분 30초",
+        ),
+        ("1985-04-12T23:20:30", "es", "full", "viernes, 12 de abril de 1985, 23:20:30"),
+        ("1985-04-12T23:20:30", "zh", "full", "1985年4月12日星期五 23:20:30"),
+        ("1985-04-12T23:20:30", "en", "HH:mm z", "23:20"),
+        ("1985-04-12T23:20:30", "en", "HH:mm (zzzz)", "23:20"),
+        ("1985-04-12T23:20:30Z", "en", "HH:mm z", "23:20 UTC"),
+        ("1985-04-12T23:20:30+04", "en", "HH:mm z", "23:20 +0400"),
+        # The end of the day.
+        ("1985-04-12T24:00:00Z", "en", "long", "April 13, 1985, 12:00:00\u202fAM UTC"),
+        # Year and month precision.
+        ("2020T10:00:00", "de", "long", "2020, 10:00:00"),
+        ("2021-02T10:00:00-05", "en", "long", "February 2021, 10:00:00\u202fAM -0500"),
+    ],
+)
+def test_format_edtf_datetime(edtfstr, locale, format, expected):
+    """Test formatting dates and times."""
+    assert format_edtf(edtfstr, format=format, locale=locale) == expected
+    assert format_edtf(parse_edtf(edtfstr), format=format, locale=locale) == expected
+
+
 def test_edtf_to_datetime():
     """Test datetime conversion."""
     y = parse_edtf_level0("2020")
@@ -139,6 +239,109 @@ def test_format_edtf_format():
     )
 
 
+def _format_edtf_babel(edtfstr, format, locale):
+    """Format an EDTF string by letting Babel resolve everything per call."""
+    edtf = parse_edtf_level0(edtfstr)
+    if isinstance(edtf, Interval):
+        start = edtf_to_datetime(edtf.lower, "lower").date()
+        end = edtf_to_datetime(edtf.upper, "upper").date()
+        skeleton = DATE_SKELETON_FORMATS[get_interval_precision(edtf)].get(format)
+        return format_interval(start, end, skeleton or format, locale=locale)
+    dt = edtf_to_datetime(edtf, "lower")
+    if edtf.precision == "day":
+        return format_date(dt.date(), format=format, locale=locale)
+    skeleton = DATE_SKELETON_FORMATS[edtf.precision].get(format)
+    return format_skeleton(skeleton or format, dt, fuzzy=True, locale=locale)
+
+
+@pytest.mark.parametrize("locale", ["en", "da", "de", "fi", "fr_CA", "ja", "ar", "ru"])
+@pytest.mark.parametrize(
+    "format",
+    [
+        "full",
+        "long",
+        "medium",
+        "short",
+        "yMd",
+        "yMMMMEEEEd",
+        "dd.MM.y",
+        "MMMM",
+        "Hm",
+        "hm",
+        "Bh",
+        "Hmv",
+    ],
+)
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        "2020",
+        "2020-09",
+        "2020-09-30",
+        "2020/2021",
+        "2020-09/2020-11",
+        "2020-09/2020-09",
+        "2020-09-30/2020-09-30",
+        "2020/2020-12-31",
+        "2020-12-31/2021-01-01",
+        "2021/2020",
+    ],
+)
+def test_format_edtf_babel(edtfstr, format, locale):
+    """Test the cached formatters format exactly like Babel, or fail like it."""
+    try:
+        expected = _format_edtf_babel(edtfstr, format, locale)
+    except (AttributeError, NotImplementedError) as e:
+        # E.g. hours of a day, or Babel failing to compare "B" fields.
+        with pytest.raises(type(e)):
+            format_edtf(edtfstr, format=format, locale=locale)
+    else:
+        assert format_edtf(edtfstr, format=format, locale=locale) == expected
+
+
+def test_format_edtf_babel_fallbacks():
+    """Test intervals which the cached patterns leave to Babel."""
+    # Not a level 0 interval.
+    interval = edtf_parse_edtf("201X/2020")
+    assert format_edtf(interval, locale="en") == f"2010{separator}2020"
+    # No skeleton.
+    assert format_edtf("2020/2021", format="", locale="en") == (
+        f"Jan 1, 2020{separator}Dec 31, 2021"
+    )
+    # Babel fails to compare era fields, and so do we.
+    with pytest.raises(NotImplementedError):
+        format_interval(date(2020, 1, 1), date(2021, 12, 31), "Gy", locale="en")
+    with pytest.raises(NotImplementedError):
+        format_edtf("2020/2021", format="Gy", locale="en")
+    assert format_edtf("2020-09-30/2020-09-30", format="Gy", locale="en") == "2020 AD"
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "yy",
+        "u G",
+        "GGGGG",
+        "MMMMM",
+        "LLL",
+        "e",
+        "c",
+        "EEEEEE d",
+        "D",
+        "QQQ y",
+        "'%' d",
+    ],
+)
+def test_compile_pattern(pattern):
+    """Test compiled patterns format like Babel."""
+    pattern = parse_pattern(pattern)
+    for locale in ["en", "de", "ar", "fa"]:
+        locale = Locale.parse(locale)
+        compiled = _compile_pattern(pattern, locale)
+        for value in [date(2020, 9, 30), date(5, 1, 4), date(2021, 12, 26)]:
+            assert compiled(value) == pattern.apply(value, locale)
+
+
 @pytest.mark.parametrize(
     "edtfstr,expected",
     [
@@ -215,3 +418,40 @@ def test_parse_edtf(edtfstr, expected):
 def test_parse_edtf_invalid(edtfstr):
     """Test invalid values to parse_edtf."""
     pytest.raises(EDTFParseException, parse_edtf, edtfstr)
+
+
+def test_format_edtf_many():
+    """Test formatting many values at once."""
+    values = ["2020-09", "2020/2021", "2020-09", parse_edtf("2020-09-30")]
+    assert format_edtf_many(values, format="long", locale="en") == [
+        "September 2020",
+        f"2020{separator}2021",
+        "September 2020",
+        "September 30, 2020",
+    ]
+    assert format_edtf_many(iter([]), locale="en") == []
+    pytest.raises(ValueError, format_edtf_many, ["2020", "invalid"])
+
+
+def test_format_edtf_many_errors():
+    """Test returning the errors of the values which can't be formatted."""
+    values = ["2020", "invalid", "2020/..", "invalid", 2020]
+    result = format_edtf_many(values, locale="en", errors="return")
+    assert result[0] == "2020"
+    assert isinstance(result[1], EDTFValueError)
+    assert result[2] == "since 2020"
+    assert result[3] is result[1]
+    assert isinstance(result[4], EDTFTypeError)
+    pytest.raises(ValueError, format_edtf_many, values, errors="ignore")
+
+
+def test_parse_edtf_many():
+    """Test parsing many values at once."""
+    values = parse_edtf_many(["2020", "2020-09/2021", "2020"])
+    assert values == [
+        Date("2020"),
+        Interval(Date("2020", "09"), Date("2021")),
+        Date("2020"),
+    ]
+    assert values[0] is not values[2]
+    pytest.raises(EDTFParseException, parse_edtf_many, ["2020", "2021-02-29"])
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""NumPy arrays tests."""
+
+import pytest
+from edtf.parser.edtf_exceptions import EDTFParseException
+
+from babel_edtf import edtf_to_datetime, parse_edtf
+
+np = pytest.importorskip("numpy")
+edtf_to_datetime64 = pytest.importorskip("babel_edtf.arrays").edtf_to_datetime64
+
+values = [
+    "2020",
+    "2020-02",
+    "2021-02",
+    "2020-09-30",
+    "2020-02-29",
+    "2020/2021",
+    "2020-09/2021",
+    "2020-09-02/2020-11",
+    "1985-04-12T23:20:30+04:30",
+    "1000",
+    "9999-12",
+    # Objects
+    parse_edtf("2020-12"),
+    parse_edtf("2020/2021-02"),
+    parse_edtf("1985-04-12T23:20:30"),
+    parse_edtf("2020S2"),
+    "2020S2/2021-02",
+    "2020S2T10:00:00",
+    # Level 1
+    "2020?",
+    parse_edtf("2020-09~"),
+]
+
+
+def test_edtf_to_datetime64():
+    """Test the arrays match edtf_to_datetime."""
+    lower, upper, precision = edtf_to_datetime64(values)
+    assert lower.dtype == upper.dtype == np.dtype("datetime64[D]")
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            value = parse_edtf(value)
+        assert lower[i] == np.datetime64(edtf_to_datetime(value, "lower").date())
+        assert upper[i] == np.datetime64(edtf_to_datetime(value, "upper").date())
+    assert list(precision) == (
+        ["year", "month", "month", "day", "day", "year", "month", "day", "day"]
+        + ["year", "month", "month", "month", "day", "year", "month", "year"]
+        + ["", ""]
+    )
+
+
+def test_edtf_to_datetime64_negative_year():
+    """Test years which datetime doesn't support."""
+    lower, upper, _ = edtf_to_datetime64(["-0100", "-0100-02"])
+    assert list(lower.astype(str)) == ["-100-01-01", "-100-02-01"]
+    assert list(upper.astype(str)) == ["-100-12-31", "-100-02-28"]
+
+
+def test_edtf_to_datetime64_empty():
+    """Test an empty sequence."""
+    lower, upper, precision = edtf_to_datetime64([])
+    assert len(lower) == len(upper) == len(precision) == 0
+
+
+def test_edtf_to_datetime64_invalid():
+    """Test invalid strings raise."""
+    pytest.raises(EDTFParseException, edtf_to_datetime64, ["2020", "2021-02-29"])
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Bounds tests."""
+
+import math
+from datetime import date, datetime
+
+import pytest
+from edtf import struct_time_to_datetime
+
+from babel_edtf import BOUND_LOWER, BOUND_UPPER, edtf_to_datetime, parse_edtf
+from babel_edtf.bounds import _edtf_to_date
+
+values = (
+    [f"{y}" for y in ["0001", "1000", "1900", "2000", "2020", "2021", "9999"]]
+    + [f"{y}-{m:02d}" for y in ["1900", "2000", "2020", "2021"] for m in range(1, 13)]
+    + ["2020-02-29", "2021-02-28", "2020-12-31"]
+    + ["2020/2021", "2020-09/2021-02", "2020-02-29/2021-02", "2021-02-01/2024-02"]
+    + ["1985-04-12T23:20:30", "2020T10:00:00", "2021-02T10:00:00Z"]
+    + ["2020/", "/2020-09", "2020-09-30/..", "../2020"]
+    # Not level 0
+    + ["2020?", "2020-02~", "2020S2", "2020-XX"]
+)
+
+
+@pytest.mark.parametrize("edtfstr", values)
+@pytest.mark.parametrize("strict", [BOUND_LOWER, BOUND_UPPER])
+def test_edtf_to_datetime_struct_time(edtfstr, strict):
+    """Test the bounds match python-edtf's struct_time bounds."""
+    edtf_date = parse_edtf(edtfstr)
+    if strict == BOUND_LOWER:
+        expected = edtf_date.lower_strict()
+    else:
+        expected = edtf_date.upper_strict()
+    # python-edtf gives infinite bounds for open ends.
+    if expected == -math.inf:
+        expected = datetime.min
+    elif expected == math.inf:
+        expected = datetime(9999, 12, 31)
+    else:
+        expected = struct_time_to_datetime(expected)
+
+    assert edtf_to_datetime(edtf_date, strict) == expected
+    result = _edtf_to_date(edtf_date, strict)
+    assert type(result) is date
+    assert result == expected.date()
+
+
+def test_edtf_to_date_invalid():
+    """Test invalid values for the strict parameter."""
+    pytest.raises(ValueError, _edtf_to_date, parse_edtf("2020"), "invalid")
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Parse cache tests."""
+
+import pytest
+from edtf import Date, Interval
+from edtf.parser.edtf_exceptions import EDTFParseException
+
+from babel_edtf import (
+    disable_parse_cache,
+    enable_parse_cache,
+    parse_cache_clear,
+    parse_cache_info,
+    parse_edtf,
+    parse_edtf_level0,
+)
+
+
+@pytest.fixture()
+def parse_cache():
+    """Enable the parse cache for the duration of a test."""
+    enable_parse_cache(maxsize=2)
+    yield
+    disable_parse_cache()
+
+
+def test_parse_cache_disabled():
+    """Test the cache is disabled by default."""
+    assert parse_cache_info() is None
+    parse_cache_clear()
+    assert parse_edtf("2020") == Date("2020")
+
+
+def test_parse_cache_info(parse_cache):
+    """Test hits and misses are recorded."""
+    assert parse_edtf("2020") == Date("2020")
+    assert parse_edtf_level0("2020") == Date("2020")
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 2, 1)
+
+    parse_cache_clear()
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_parse_cache_bounded(parse_cache):
+    """Test the least recently used strings are evicted."""
+    for edtfstr in ["2020", "2021", "2022", "2020"]:
+        parse_edtf(edtfstr)
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 4, 2)
+
+
+def test_parse_cache_invalid(parse_cache):
+    """Test invalid strings still raise."""
+    for _ in range(2):
+        pytest.raises(EDTFParseException, parse_edtf, "2021-02-29")
+    assert parse_cache_info().currsize == 0
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    ["2020-09-30", "2020/2021-09", "1985-04-12T23:20:30Z", "2020?", "2021/.."],
+)
+def test_parse_cache_copies(parse_cache, edtfstr):
+    """Test callers can't modify cached objects."""
+    first = parse_edtf(edtfstr)
+    second = parse_edtf(edtfstr)
+    assert first == second
+    assert first is not second
+
+    if isinstance(first, Interval):
+        first.lower = Date("1900")
+    elif isinstance(first, Date):
+        first.year = "1900"
+    else:
+        first.date = Date("1900")
+    assert str(parse_edtf(edtfstr)) == str(second)
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Command line interface tests."""
+
+import io
+import json
+
+import pytest
+
+from babel_edtf.cli import main
+
+values = ["2020", "2020-09", "2020-09-30", "2020-09/2021-11", "2021-02-03T10:00:00"]
+
+
+def run(monkeypatch, capsys, argv, stdin=""):
+    """Run the command with an input, and return its exit code and output."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    code = main(argv)
+    out, err = capsys.readouterr()
+    return code, out, err
+
+
+def test_lines(monkeypatch, capsys):
+    """Test formatting one value per line."""
+    stdin = "\n".join(values + ["", "invalid"]) + "\n"
+    code, out, err = run(monkeypatch, capsys, ["-l", "da", "-f", "long"], stdin)
+    assert code == 0
+    assert out.splitlines() == [
+        "2020",
+        "september 2020",
+        "30. september 2020",
+        "september 2020–november 2021",
+        "3. februar 2021 10.00.00",
+        "",
+        "invalid",
+    ]
+    assert err == "babel-edtf: 1 invalid value(s) left unchanged\n"
+
+
+@pytest.mark.parametrize(
+    "bound,expected",
+    [
+        ("lower", ["2020", "Sep 2020", "Sep 30, 2020", "Sep 2020", "Feb 3, 2021"]),
+        ("upper", ["2020", "Sep 2020", "Sep 30, 2020", "Nov 2021", "Feb 3, 2021"]),
+    ],
+)
+def test_bound(monkeypatch, capsys, bound, expected):
+    """Test formatting only a bound of the values."""
+    code, out, _ = run(monkeypatch, capsys, ["-b", bound], "\n".join(values))
+    assert code == 0
+    assert out.splitlines() == expected
+
+
+def test_jsonl(monkeypatch, capsys):
+    """Test formatting a field of JSON records."""
+    stdin = '{"id": 1, "date": "2020-09"}\n\n{"id": 2}\n'
+    argv = ["--input", "jsonl", "--field", "date", "--output-field", "label"]
+    code, out, _ = run(monkeypatch, capsys, argv, stdin)
+    assert code == 0
+    assert [json.loads(line) for line in out.splitlines()] == [
+        {"id": 1, "date": "2020-09", "label": "Sep 2020"},
+        {"id": 2},
+    ]
+
+
+def test_jsonl_not_object(monkeypatch, capsys):
+    """Test records which aren't JSON objects are invalid."""
+    stdin = '[1, 2]\n{"date": "2020"}\n'
+    argv = ["--input", "jsonl", "--field", "date"]
+    code, out, err = run(monkeypatch, capsys, argv, stdin)
+    assert code == 0
+    assert out.splitlines() == ["[1, 2]", '{"date": "2020"}']
+    assert err == "babel-edtf: 1 invalid value(s) left unchanged\n"
+
+    code, out, err = run(monkeypatch, capsys, [*argv, "--strict"], stdin)
+    assert code == 1
+    assert err == "babel-edtf: 1: [1, 2]: the record is not a JSON object\n"
+
+
+def test_csv(monkeypatch, capsys, tmp_path):
+    """Test formatting a column of CSV files, in place of the column."""
+    paths = [tmp_path / "a.csv", tmp_path / "b.csv"]
+    paths[0].write_text("id,date\n1,2020-09-30\n2,\n")
+    paths[1].write_text("id,date\n3,2020/2021\n")
+    argv = ["--input", "csv", "--field", "date", "-l", "de", *map(str, paths)]
+    code, out, _ = run(monkeypatch, capsys, argv)
+    assert code == 0
+    assert out.splitlines() == ["id,date", "1,30.09.2020", "2,", "3,2020–2021"]
+
+    argv = ["--input", "csv", "--field", "date", "--output-field", "label"]
+    code, out, _ = run(monkeypatch, capsys, argv, "id,date\n1,2020\n")
+    assert out.splitlines() == ["id,date,label", "1,2020,2020"]
+
+
+def test_csv_headers(capsys, tmp_path):
+    """Test CSV files with different headers are rejected."""
+    paths = [tmp_path / "a.csv", tmp_path / "b.csv", tmp_path / "c.csv"]
+    paths[0].write_text("id,date\n1,2020\n")
+    paths[1].write_text("")
+    paths[2].write_text("date,id\n2021,2\n")
+    with pytest.raises(SystemExit):
+        main(["--input", "csv", "--field", "date", *map(str, paths)])
+    assert "the CSV files have different headers" in capsys.readouterr().err
+
+
+def test_strict(monkeypatch, capsys):
+    """Test stopping at the first invalid value."""
+    code, out, err = run(monkeypatch, capsys, ["--strict"], "2020\n2020-13\n2021\n")
+    assert code == 1
+    assert out == "2020\n"
+    assert err.startswith("babel-edtf: 2: '2020-13': EDTFValueError")
+
+
+def test_jobs(monkeypatch, capsys):
+    """Test formatting with a pool of processes keeps the order of values."""
+    stdin = "\n".join(values[:4] * 5)
+    _, expected, _ = run(monkeypatch, capsys, ["-f", "short"], stdin)
+    argv = ["-f", "short", "--jobs", "2", "--chunksize", "3"]
+    code, out, _ = run(monkeypatch, capsys, argv, stdin)
+    assert code == 0
+    assert out == expected
+
+
+@pytest.mark.parametrize("argv", [["--jobs", "0"], ["--chunksize", "-1"]])
+def test_positive(capsys, argv):
+    """Test the number of jobs and the chunk size are positive."""
+    with pytest.raises(SystemExit):
+        main(argv)
+    assert "is not a positive integer" in capsys.readouterr().err
+
+
+def test_field_required(capsys):
+    """Test the field is required for records."""
+    with pytest.raises(SystemExit):
+        main(["--input", "csv"])
+    assert "--field is required" in capsys.readouterr().err
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Compact representation tests."""
+
+import pytest
+from edtf import Date, DateAndTime, Interval, UncertainOrApproximate
+
+from babel_edtf import (
+    BOUND_LOWER,
+    BOUND_UPPER,
+    CompactDate,
+    CompactInterval,
+    EDTFValueError,
+    edtf_to_datetime,
+    format_edtf,
+    get_interval_precision,
+    parse_edtf,
+    parse_edtf_compact,
+)
+
+values = [
+    "2020",
+    "0000",
+    "-0100",
+    "2020-09",
+    "2020-02-29",
+    "2020-09-30",
+    "2020/2021",
+    "2020-09/2021-02",
+    "2020-09-02/2020-11",
+    "-0100/2020",
+]
+
+
+def _state(obj):
+    """Return a comparable representation of an EDTF object."""
+    if isinstance(obj, Interval):
+        return _state(obj.lower), _state(obj.upper)
+    return type(obj), vars(obj)
+
+
+@pytest.mark.parametrize("value", values)
+def test_conversion(value):
+    """Test conversion from and to python-edtf objects is lossless."""
+    edtf_date = parse_edtf(value)
+    compact = parse_edtf_compact(value)
+    assert type(compact).from_edtf(edtf_date) == compact
+    assert _state(compact.to_edtf()) == _state(edtf_date)
+    assert str(compact) == value
+    if isinstance(edtf_date, Interval):
+        assert compact.precision == get_interval_precision(edtf_date)
+    else:
+        assert compact.precision == edtf_date.precision
+
+
+@pytest.mark.parametrize("value", [v for v in values if v[0] not in "-0"])
+def test_format_and_bounds(value):
+    """Test compact values are formatted and converted like EDTF objects."""
+    compact = parse_edtf_compact(value)
+    for format in ["short", "medium", "long", "full", "MMM y"]:
+        for locale in ["en", "da"]:
+            assert format_edtf(compact, format, locale) == format_edtf(
+                value, format, locale
+            )
+    for bound in [BOUND_LOWER, BOUND_UPPER]:
+        assert edtf_to_datetime(compact, bound) == edtf_to_datetime(
+            parse_edtf(value), bound
+        )
+
+
+def test_precision():
+    """Test the precision of dates and intervals."""
+    assert parse_edtf_compact("2020").precision == "year"
+    assert parse_edtf_compact("2020-09").precision_code == 1
+    assert parse_edtf_compact("2020-09-30").precision == "day"
+    assert parse_edtf_compact("2020/2021-02").precision == "month"
+    assert parse_edtf_compact("2020-09-30/2021").precision_code == 2
+
+
+def test_order_and_hash():
+    """Test compact values are ordered by their fields and hashable."""
+    dates = [parse_edtf_compact(v) for v in ["2021", "2020-09-30", "2020", "2020-09"]]
+    assert [str(d) for d in sorted(dates)] == ["2020", "2020-09", "2020-09-30", "2021"]
+    assert len({parse_edtf_compact("2020"), parse_edtf_compact("2020")}) == 1
+    assert parse_edtf_compact("2020/2021") < parse_edtf_compact("2020/2022")
+    with pytest.raises(AttributeError):
+        parse_edtf_compact("2020").year = 2021
+
+
+@pytest.mark.parametrize(
+    "value", ["2020?", "2020-13", "2021-02-29", "2020-09-30T10:00:00", "abc"]
+)
+def test_parse_invalid(value):
+    """Test only level 0 dates and intervals are parsed."""
+    with pytest.raises(EDTFValueError):
+        parse_edtf_compact(value)
+
+
+@pytest.mark.parametrize(
+    "cls,value",
+    [
+        (CompactDate, parse_edtf("2020?")),
+        (CompactDate, parse_edtf("2020-09-30T10:00:00")),
+        (CompactDate, Date("20XX")),
+        (CompactDate, parse_edtf("1950S2")),
+        (CompactInterval, Interval(parse_edtf("1950S2"), Date("2020"))),
+        (CompactInterval, parse_edtf("2020")),
+        (CompactInterval, parse_edtf("2020/2021?")),
+    ],
+)
+def test_from_edtf_invalid(cls, value):
+    """Test only level 0 python-edtf objects are converted."""
+    assert isinstance(value, (Date, DateAndTime, Interval, UncertainOrApproximate))
+    with pytest.raises(EDTFValueError):
+        cls.from_edtf(value)
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Format cache tests."""
+
+import os
+import sqlite3
+
+import pytest
+
+from babel_edtf import (
+    EDTFValueError,
+    LRUCache,
+    SQLiteCache,
+    disable_format_cache,
+    enable_format_cache,
+    format_edtf,
+    format_edtf_many,
+    formatting,
+)
+from babel_edtf.parsing import parse_edtf
+
+
+class DictCache:
+    """A backend recording the texts it is asked for."""
+
+    def __init__(self):
+        """Create an empty cache."""
+        self.texts = {}
+        self.gets = []
+
+    def get(self, key):
+        """Return the text of a key."""
+        self.gets.append(key)
+        return self.texts.get(key)
+
+    def set(self, key, text):
+        """Cache the text of a key."""
+        self.texts[key] = text
+
+
+@pytest.fixture()
+def format_cache():
+    """Enable the format cache with a ``DictCache`` for a test."""
+    cache = DictCache()
+    enable_format_cache(cache)
+    yield cache
+    disable_format_cache()
+    formatting._format_cache_prefix.cache_clear()
+
+
+def test_format_cache(format_cache):
+    """Test strings are formatted once per format and locale."""
+    for _ in range(2):
+        assert format_edtf("2020-09", locale="en") == "Sep 2020"
+        assert format_edtf("2020-09", "long", "en") == "September 2020"
+        assert format_edtf_many(["2020-09"], locale="de") == ["Sept. 2020"]
+    assert len(format_cache.texts) == 3
+    assert len(format_cache.gets) == 6
+    assert sorted(format_cache.texts.values()) == [
+        "Sep 2020",
+        "Sept. 2020",
+        "September 2020",
+    ]
+
+    # Only strings are cached.
+    assert format_edtf(parse_edtf("2021"), locale="en") == "2021"
+    assert len(format_cache.gets) == 6
+
+
+def test_format_cache_invalid(format_cache):
+    """Test invalid strings are not cached, and still raise."""
+    for _ in range(2):
+        pytest.raises(EDTFValueError, format_edtf, "2021-02-29")
+    assert format_cache.texts == {}
+
+
+def test_format_cache_versions(format_cache, monkeypatch):
+    """Test entries of other versions of Babel are not used."""
+    format_edtf("2020", locale="en")
+    format_cache.texts = {key: "stale" for key in format_cache.texts}
+    assert format_edtf("2020", locale="en") == "stale"
+
+    monkeypatch.setattr(formatting, "babel_version", "0.0.0")
+    formatting._format_cache_prefix.cache_clear()
+    assert format_edtf("2020", locale="en") == "2020"
+    assert len(format_cache.texts) == 2
+
+
+def test_format_cache_default():
+    """Test the cache is disabled by default, and an LRU cache if enabled."""
+    assert formatting._format_cache is None
+    enable_format_cache()
+    try:
+        assert isinstance(formatting._format_cache, LRUCache)
+        assert format_edtf("2020-09", locale="en") == "Sep 2020"
+        assert len(formatting._format_cache) == 1
+    finally:
+        disable_format_cache()
+
+
+def test_lru_cache():
+    """Test the least recently used texts are evicted."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("A", None, "C")
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_sqlite_cache(tmp_path):
+    """Test texts are shared by the connections to a database."""
+    first = SQLiteCache(tmp_path / "formatted.db")
+    second = SQLiteCache(str(tmp_path / "formatted.db"))
+    assert first.get("a") is None
+    first.set("a", "A")
+    first.set("a", "Å")
+    assert second.get("a") == "Å"
+    second.clear()
+    assert first.get("a") is None
+
+
+def test_sqlite_cache_format(tmp_path):
+    """Test format_edtf() with a database shared by several caches."""
+    enable_format_cache(SQLiteCache(tmp_path / "formatted.db"))
+    try:
+        text = format_edtf("2020-09/2021-02", locale="en")
+        assert format_edtf("2020-09/2021-02", locale="en") == text
+    finally:
+        disable_format_cache()
+    shared = SQLiteCache(tmp_path / "formatted.db")
+    texts = shared._connection().execute("SELECT text FROM texts").fetchall()
+    assert texts == [(text,)]
+
+
+def test_sqlite_cache_fork(tmp_path, monkeypatch):
+    """Test a forked process opens its own connection."""
+    cache = SQLiteCache(tmp_path / "formatted.db")
+    cache.set("a", "A")
+    connection = cache._local.connection
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    assert cache.get("a") == "A"
+    assert cache._local.connection is not connection
+
+
+def test_sqlite_cache_locked(tmp_path):
+    """Test texts are not cached while another process writes."""
+    cache = SQLiteCache(tmp_path / "formatted.db", timeout=0.01)
+    cache.set("a", "A")
+    writer = sqlite3.connect(tmp_path / "formatted.db", isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        cache.set("b", "B")
+        assert (cache.get("a"), cache.get("b")) == ("A", None)
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    cache.set("b", "B")
+    assert cache.get("b") == "B"
+
+
+def test_sqlite_cache_locked_read(tmp_path):
+    """Test reading a locked database is a cache miss."""
+    path = tmp_path / "formatted.db"
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN EXCLUSIVE")
+    cache = SQLiteCache(path, timeout=0.01)
+    enable_format_cache(cache)
+    try:
+        assert cache.get("a") is None
+        assert format_edtf("2020-09", locale="en") == "Sep 2020"
+    finally:
+        disable_format_cache()
+        writer.execute("ROLLBACK")
+        writer.close()
+    cache.set("a", "A")
+    assert cache.get("a") == "A"
@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Histogram tests."""
+
+import random
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from babel_edtf import (
+    BOUND_LOWER,
+    BOUND_UPPER,
+    EDTFValueError,
+    edtf_histogram,
+    edtf_to_datetime,
+    format_edtf,
+    parse_edtf,
+    parse_edtf_compact,
+)
+
+
+def _values(size, seed):
+    """Return random level 0 values, and some which are not."""
+    rng = random.Random(seed)
+
+    def value():
+        year = rng.randint(1890, 2030)
+        kind = rng.randint(0, 3)
+        if kind == 0:
+            return str(year)
+        elif kind == 1:
+            return f"{year}-{rng.randint(1, 12):02d}"
+        elif kind == 2:
+            return f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        return f"{year}-{rng.randint(1, 12):02d}-01T10:00:00Z"
+
+    values = [value() for _ in range(size)]
+    for _ in range(size):
+        lower, upper = sorted(value()[:10] for _ in range(2))
+        values.append(f"{lower}/{upper}")
+    values += ["2020?", "2020-09~", "2019-12/..", "../2020-02"]
+    return values
+
+
+def _buckets(value, granularity):
+    """Return the buckets of a value with edtf_to_datetime."""
+    edtf_date = parse_edtf(value)
+    lower = edtf_to_datetime(edtf_date, BOUND_LOWER)
+    upper = edtf_to_datetime(edtf_date, BOUND_UPPER)
+    months = range(lower.year * 12 + lower.month - 1, upper.year * 12 + upper.month)
+    if granularity == "month":
+        return {f"{m // 12:04d}-{m % 12 + 1:02d}" for m in months}
+    elif granularity == "year":
+        return {f"{m // 12:04d}" for m in months}
+    years = 10 if granularity == "decade" else 100
+    return {
+        f"{m // 12 // years * years:04d}/{m // 12 // years * years + years - 1:04d}"
+        for m in months
+    }
+
+
+values = _values(300, 1)
+
+
+@pytest.mark.parametrize("granularity", ["century", "decade", "year", "month"])
+def test_histogram(granularity):
+    """Test the counts against the bounds of edtf_to_datetime."""
+    expected = Counter()
+    for value in values:
+        expected.update(_buckets(value, granularity))
+    expected = {
+        edtf: count for edtf, count in expected.items() if "1800" <= edtf[:4] <= "2099"
+    }
+    buckets = edtf_histogram(
+        values, granularity, locale="en", start="1800", end=date(2099, 12, 31)
+    )
+    assert {b.edtf: b.count for b in buckets} == expected
+    assert [b.edtf for b in buckets] == sorted(expected)
+    for bucket in buckets[:20]:
+        assert bucket.label == format_edtf(bucket.edtf, locale="en")
+
+
+def test_histogram_objects():
+    """Test EDTF objects and compact values are counted like strings."""
+    strings = ["2020-09-30", "2019/2021-02", "2021-01-01T10:00:00Z", "2020~"]
+    objects = [
+        parse_edtf_compact("2020-09-30"),
+        parse_edtf_compact("2019/2021-02"),
+        parse_edtf("2021-01-01T10:00:00Z"),
+        parse_edtf("2020~"),
+    ]
+    expected = edtf_histogram(strings, format="short", locale="de")
+    assert edtf_histogram(objects, format="short", locale="de") == expected
+    assert [tuple(b) for b in expected] == [
+        ("2019", "2019", 1),
+        ("2020", "2020", 3),
+        ("2021", "2021", 2),
+    ]
+
+
+def test_histogram_open():
+    """Test open ends are clipped to the bounds of the values by default."""
+    buckets = edtf_histogram(["2020-11/..", "2021-02"], "month", locale="en")
+    assert [(b.edtf, b.count) for b in buckets] == [
+        ("2020-11", 1),
+        ("2020-12", 1),
+        ("2021-01", 1),
+        ("2021-02", 2),
+    ]
+    buckets = edtf_histogram(["../2020", "2019~"], locale="en")
+    assert [(b.edtf, b.count) for b in buckets] == [("2019", 2), ("2020", 1)]
+    buckets = edtf_histogram(["2020/.."], "month", locale="en")
+    assert [(b.edtf, b.count) for b in buckets] == [("2020-01", 1)]
+    assert edtf_histogram(["../.."]) == []
+
+    # Or to the given bounds.
+    buckets = edtf_histogram(["../2020", "2021"], start="2019", end="2022")
+    assert [(b.edtf, b.count) for b in buckets] == [
+        ("2019", 1),
+        ("2020", 1),
+        ("2021", 1),
+    ]
+
+
+def test_histogram_labels():
+    """Test the labels, and the buckets which can't be formatted."""
+    buckets = edtf_histogram(["-0150/0005"], "century", locale="en")
+    assert [(b.edtf, b.label) for b in buckets] == [
+        ("-0200/-0101", None),
+        ("-0100/-0001", None),
+        ("0000/0099", None),
+    ]
+    buckets = edtf_histogram(["2020-09/2020-10"], "month", "long", "fr")
+    assert [b.label for b in buckets] == ["septembre 2020", "octobre 2020"]
+    assert edtf_histogram([], "month") == []
+
+
+def test_histogram_invalid():
+    """Test invalid values and granularities."""
+    pytest.raises(ValueError, edtf_histogram, ["2020"], "week")
+    pytest.raises(EDTFValueError, edtf_histogram, ["2020-09-30/2020-09-01"])
+    pytest.raises(EDTFValueError, edtf_histogram, [parse_edtf("2021/2020")])
+    pytest.raises(EDTFValueError, edtf_histogram, ["2020"], end="2021~/2020")
@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Index tests."""
+
+import random
+from datetime import date
+
+import pytest
+
+from babel_edtf import (
+    BOUND_LOWER,
+    BOUND_UPPER,
+    EDTFIndex,
+    EDTFValueError,
+    edtf_to_datetime,
+    parse_edtf,
+    parse_edtf_compact,
+)
+
+
+def _bounds(value):
+    """Return the bounds of a value with edtf_to_datetime."""
+    if isinstance(value, date):
+        return value, value
+    edtf_date = parse_edtf(value)
+    return (
+        edtf_to_datetime(edtf_date, BOUND_LOWER).date(),
+        edtf_to_datetime(edtf_date, BOUND_UPPER).date(),
+    )
+
+
+def _values(size, seed):
+    """Return random level 0 values."""
+    rng = random.Random(seed)
+
+    def value():
+        year = rng.randint(1990, 2030)
+        kind = rng.randint(0, 2)
+        if kind == 0:
+            return str(year)
+        elif kind == 1:
+            return f"{year}-{rng.randint(1, 12):02d}"
+        return f"{year}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+    values = []
+    for _ in range(size):
+        if rng.random() < 0.5:
+            values.append(value())
+        else:
+            lower, upper = value(), value()
+            if _bounds(upper)[1] < _bounds(lower)[0]:
+                lower, upper = upper, lower
+            values.append(f"{lower}/{upper}")
+    return values
+
+
+def _scan(values, query, match):
+    """Return the keys of the matching values, ordered like the index."""
+    lower, upper = _bounds(query)
+    found = [(_bounds(v), key) for key, v in values.items()]
+    found = [(bounds, key) for bounds, key in found if match(*bounds, lower, upper)]
+    return [key for _, key in sorted(found)]
+
+
+values = dict(enumerate(_values(500, 1)))
+queries = _values(100, 2) + [date(2020, 9, 30), "1000/3000"]
+
+
+@pytest.fixture(scope="module")
+def index():
+    """Return an index of the values."""
+    return EDTFIndex(values.items())
+
+
+@pytest.mark.parametrize("query", queries)
+def test_overlapping(index, query):
+    """Test the values overlapping a value."""
+    expected = _scan(values, query, lambda lo, up, a, b: lo <= b and up >= a)
+    assert index.overlapping(query) == expected
+
+
+@pytest.mark.parametrize("query", queries)
+def test_within(index, query):
+    """Test the values within a value."""
+    expected = _scan(values, query, lambda lo, up, a, b: lo >= a and up <= b)
+    assert index.within(query) == expected
+
+
+@pytest.mark.parametrize("query", queries)
+def test_containing(index, query):
+    """Test the values containing a value."""
+    expected = _scan(values, query, lambda lo, up, a, b: lo <= a and up >= b)
+    assert index.containing(query) == expected
+
+
+def test_at(index):
+    """Test the values including a day."""
+    expected = _scan(values, date(2020, 9, 30), lambda lo, up, a, b: lo <= a <= up)
+    assert index.at(date(2020, 9, 30)) == expected
+    assert index.at("2020-09-30") == expected
+    pytest.raises(EDTFValueError, index.at, "2020-09")
+
+
+def test_insert_delete():
+    """Test inserting and deleting values one at a time."""
+    index = EDTFIndex()
+    for key, value in values.items():
+        index.insert(key, value)
+    assert len(index) == len(values)
+    for key in range(0, len(values), 2):
+        index.delete(key)
+    remaining = {key: v for key, v in values.items() if key % 2}
+    assert set(index) == set(remaining)
+    assert 1 in index and 0 not in index
+    for query in queries[:20]:
+        assert index.overlapping(query) == _scan(
+            remaining, query, lambda lo, up, a, b: lo <= b and up >= a
+        )
+    pytest.raises(KeyError, index.delete, 0)
+
+
+def test_replace():
+    """Test indexing a key again replaces its value."""
+    index = EDTFIndex([("a", "2020"), ("b", parse_edtf_compact("2021"))])
+    index.insert("a", parse_edtf("2022"))
+    index.update([("b", "2023-01-01T10:00:00")])
+    assert len(index) == 2
+    assert index.overlapping("2020/2021") == []
+    assert index.overlapping("2022/2023") == ["a", "b"]
+
+
+def test_update_repeated():
+    """Test the last value of a key repeated in a bulk load is indexed."""
+    index = EDTFIndex([("a", "2020"), ("b", "1990"), ("a", "2000")])
+    assert len(index) == 2
+    assert index.overlapping("1990/2020") == ["b", "a"]
+    index.update([("a", "2020"), ("c", "2021"), ("b", "2022"), ("a", "2019")])
+    assert len(index) == 3
+    assert index.overlapping("1990/2022") == ["a", "c", "b"]
+    assert index.at("2021-06-01") == ["c"]
+
+
+def test_update_invalid():
+    """Test an invalid value leaves the index unchanged."""
+    index = EDTFIndex([("a", "2020")])
+    with pytest.raises(EDTFValueError):
+        index.update([("c", "1980"), ("a", "1990"), ("d", "bogus")])
+    assert len(index) == 1 and "c" not in index
+    assert index.overlapping("1980/2020") == ["a"]
+
+
+def test_before_year_1():
+    """Test indexing zero and negative years."""
+    index = EDTFIndex([("a", "-0100"), ("b", "0000"), ("c", "-0001/0001-06")])
+    assert index.overlapping("-0001-12-31/0000-01") == ["c", "b"]
+    assert index.within("-0100/0000") == ["a", "b"]
+    assert index.containing("0000-06-30") == ["c", "b"]
+    assert index.at(date(1, 1, 1)) == ["c"]
+
+
+def test_invalid():
+    """Test non level 0 values are rejected."""
+    pytest.raises(EDTFValueError, EDTFIndex, [("a", "2020?")])
+    pytest.raises(EDTFValueError, EDTFIndex().overlapping, "2020/..")
+    pytest.raises(EDTFValueError, EDTFIndex, [("a", "2021/2020")])
+    pytest.raises(EDTFValueError, EDTFIndex().within, "2021/2020")
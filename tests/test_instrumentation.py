@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Instrumentation tests."""
+
+import threading
+
+import pytest
+
+from babel_edtf import (
+    EDTFValueError,
+    disable_instrumentation,
+    enable_instrumentation,
+    format_edtf,
+    formatting,
+    instrumentation_clear,
+    instrumentation_info,
+    parse_edtf,
+    parsing,
+)
+from babel_edtf.cli import _format_value
+from babel_edtf.parsing import _parse_level0
+
+
+@pytest.fixture()
+def calls():
+    """Enable the instrumentation for a test, and return the callback calls."""
+    calls = []
+    enable_instrumentation(lambda *args: calls.append(args))
+    yield calls
+    disable_instrumentation()
+
+
+def _counts():
+    """Return the calls and hits of each stage."""
+    return {
+        stage: (info.calls, info.hits) for stage, info in instrumentation_info().items()
+    }
+
+
+def test_disabled():
+    """Test the functions of the stages are not replaced when disabled."""
+    assert instrumentation_info() is None
+    instrumentation_clear()
+    disable_instrumentation()
+    assert parsing._parse_level0 is _parse_level0
+
+
+def test_parse(calls):
+    """Test the parsing stages are recorded."""
+    parse_edtf("2020-09")
+    parse_edtf("2020?")
+    with pytest.raises(EDTFValueError):
+        parsing.parse_edtf_level0("2021-02-29")
+    assert _counts() == {
+        "parse.fast_path": (3, 1),
+        "parse.grammar": (2, 2),
+        "parse.leap_year": (2, 1),
+        "format.date": (0, 0),
+        "format.interval": (0, 0),
+        "format.datetime": (0, 0),
+    }
+    assert [(stage, hit) for stage, _, hit in calls] == [
+        ("parse.fast_path", True),
+        ("parse.fast_path", False),
+        ("parse.grammar", True),
+        ("parse.leap_year", True),
+        ("parse.fast_path", False),
+        ("parse.grammar", True),
+        ("parse.leap_year", False),
+    ]
+    info = instrumentation_info()["parse.grammar"]
+    assert 0 < info.max <= info.total
+    assert all(duration >= 0 for _, duration, _ in calls)
+
+
+def test_format(calls):
+    """Test the formatting stages are recorded."""
+    assert format_edtf("2020-09", locale="da") == "sep. 2020"
+    format_edtf("2020-09/2021", locale="da")
+    format_edtf("2020-09-30T10:00:00", locale="da")
+    assert _counts()["format.date"] == (1, 1)
+    assert _counts()["format.interval"] == (1, 1)
+    assert _counts()["format.datetime"] == (1, 1)
+
+    instrumentation_clear()
+    assert set(_counts().values()) == {(0, 0)}
+
+
+def test_nested_stages(calls):
+    """Test the stages of intervals and of the command line interface."""
+    parse_edtf("2020?/2021")
+    assert _counts()["parse.leap_year"] == (1, 1)
+
+    format_edtf("2020-09/..", locale="da")
+    assert _counts()["format.interval"] == (1, 1)
+    assert _counts()["format.date"] == (1, 1)
+
+    _format_value.cache_clear()
+    _format_value("2020/2021", "medium", "da", "upper")
+    assert _counts()["format.date"] == (2, 2)
+
+
+def test_enable_twice():
+    """Test enabling again clears the statistics and keeps one wrapper."""
+    enable_instrumentation()
+    parse_edtf("2020")
+    enable_instrumentation()
+    assert parsing._parse_level0.__wrapped__ is _parse_level0
+    assert _counts()["parse.fast_path"] == (0, 0)
+    parse_edtf("2020")
+    assert _counts()["parse.fast_path"] == (1, 1)
+    disable_instrumentation()
+    assert parsing._parse_level0 is _parse_level0
+    assert formatting._format_edtf0_date.__name__ == "_format_edtf0_date"
+
+
+def test_disable_during_call():
+    """Test calls running while the instrumentation is disabled still work."""
+    enable_instrumentation()
+    instrumented = parsing._parse_level0
+    disable_instrumentation()
+    assert instrumented("2020") == parse_edtf("2020")
+    assert instrumentation_info() is None
+
+
+def test_enable_concurrently():
+    """Test enabling from several threads wraps the stages only once."""
+    threads = [threading.Thread(target=enable_instrumentation) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert parsing._parse_level0.__wrapped__ is _parse_level0
+    disable_instrumentation()
+    assert parsing._parse_level0 is _parse_level0
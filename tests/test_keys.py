@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Sort key tests."""
+
+from array import array
+from bisect import bisect_left
+from datetime import date
+
+import pytest
+
+from babel_edtf import (
+    BOUND_LOWER,
+    BOUND_UPPER,
+    EDTFValueError,
+    edtf_ordinals,
+    edtf_sort_key,
+    edtf_sort_keys,
+    edtf_to_datetime,
+    parse_edtf,
+    parse_edtf_compact,
+)
+
+values = [
+    "2020",
+    "2020-09",
+    "2020-02-29",
+    "2020-09-30T10:00:00Z",
+    "2020/2021",
+    "2020-09/2021-02",
+    "2020-09-02/2020-11",
+    "9999-12-31",
+    "0001-01-01",
+]
+
+
+@pytest.mark.parametrize("value", values)
+def test_consistent_with_bounds(value):
+    """Test the ordinals are the ones of the bounds of edtf_to_datetime."""
+    edtf_date = parse_edtf(value)
+    lower, upper, _ = edtf_ordinals(value)
+    assert lower == edtf_to_datetime(edtf_date, BOUND_LOWER).toordinal()
+    assert upper == edtf_to_datetime(edtf_date, BOUND_UPPER).toordinal()
+    assert edtf_sort_key(edtf_date) == edtf_sort_key(value)
+    if "T" not in value:
+        assert edtf_sort_key(parse_edtf_compact(value)) == edtf_sort_key(value)
+
+
+def test_precision():
+    """Test the precision codes."""
+    assert edtf_ordinals("2020")[2] == 0
+    assert edtf_ordinals("2020-09")[2] == 1
+    assert edtf_ordinals("2020-09-30T10:00:00")[2] == 2
+    assert edtf_ordinals("2020/2020-09-30")[2] == 2
+
+
+def test_before_year_1():
+    """Test the ordinals of zero and negative years continue the calendar."""
+    assert edtf_ordinals("0000") == (-365, 0, 0)
+    assert edtf_ordinals("-0001-12-31")[0] == -366
+    assert edtf_ordinals("-0100") == (-36889, -36525, 0)
+    # 400 years, year 0 and March to December.
+    assert edtf_ordinals("-0401-03-01")[0] == 1 - 146097 - 366 - 306
+    assert edtf_ordinals(parse_edtf("-0100/0001-01")) == (-36889, 31, 1)
+    assert edtf_sort_key("-0100/0001-01") < edtf_sort_key("0000/0001")
+    for value in ["0000", "-0100", "-0100/0000-12-31"]:
+        pytest.raises(EDTFValueError, edtf_sort_key, value)
+
+
+def test_sort_keys():
+    """Test sorting and bisecting the sort keys."""
+    keys = edtf_sort_keys(values + ["2020"])
+    assert isinstance(keys, array) and keys.typecode == "q"
+    assert list(keys) == [edtf_sort_key(v) for v in values + ["2020"]]
+    assert edtf_sort_keys([parse_edtf("2020")]) == keys[:1]
+
+    # Sorted by lower bound, upper bound and precision.
+    order = sorted(range(len(values)), key=keys.__getitem__)
+    assert [values[i] for i in order] == [
+        "0001-01-01",
+        "2020",
+        "2020/2021",
+        "2020-02-29",
+        "2020-09",
+        "2020-09/2021-02",
+        "2020-09-02/2020-11",
+        "2020-09-30T10:00:00Z",
+        "9999-12-31",
+    ]
+
+    # Values starting in September 2020 or later.
+    keys = sorted(keys)
+    i = bisect_left(keys, date(2020, 9, 1).toordinal() << 24)
+    assert len(keys) - i == 5 and keys[i] == edtf_sort_key("2020-09")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2020?",
+        "2020-13",
+        None,
+        parse_edtf("2020?"),
+        parse_edtf("2021/.."),
+        parse_edtf("1950S2"),
+    ],
+)
+def test_invalid(value):
+    """Test only level 0 values have sort keys."""
+    with pytest.raises(EDTFValueError):
+        edtf_sort_key(value)
@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Parity tests of the compiled level 0 parser against the EDTF grammar."""
+
+from datetime import timedelta, timezone
+from itertools import product
+
+import pytest
+from edtf import EDTFObject
+from edtf import parse_edtf as edtf_parse_edtf
+from edtf.parser.edtf_exceptions import EDTFParseException
+from edtf.parser.parser_classes import Level1Interval
+
+from babel_edtf import (
+    EDTFValueError,
+    is_valid_edtf_level0,
+    parse_edtf,
+    validate_many,
+)
+from babel_edtf.parsing import _parse_level0, _parse_level0_time
+
+years = ["0000", "0001", "1000", "1900", "2000", "2020", "2021", "9999", "-0100"]
+months = [None, "00", "01", "02", "04", "09", "12", "13"]
+days = [None, "00", "01", "28", "29", "30", "31", "32"]
+times = [
+    "00:00:00",
+    "23:59:59",
+    "24:00:00",
+    "23:20:30Z",
+    "23:20:30-04",
+    "23:20:30+04:30",
+    "23:20:30+13",
+    "23:20:30+14:00",
+    "23:20:30+00:30",
+    # Invalid times
+    "24:00:01",
+    "23:60:00",
+    "23:20:30+00",
+    "23:20:30+00:00",
+    "23:20:30+14",
+    "23:20:30+04:60",
+    "23:20",
+]
+
+
+def _dates():
+    for year, month, day in product(years, months, days):
+        if month is None and day is not None:
+            continue
+        yield "-".join(p for p in (year, month, day) if p is not None)
+
+
+def _state(obj):
+    """Return a comparable representation of an EDTF object."""
+    if isinstance(obj, EDTFObject):
+        return type(obj), {k: _state(v) for k, v in vars(obj).items()}
+    return obj
+
+
+def _grammar(edtfstr):
+    try:
+        return edtf_parse_edtf(edtfstr)
+    except EDTFParseException:
+        return None
+
+
+def _assert_parity(edtfstr):
+    result = _parse_level0(edtfstr)
+    level0 = result is not None and type(result) is not Level1Interval
+    assert is_valid_edtf_level0(edtfstr) is level0
+    if result is not None:
+        assert _state(result) == _state(_grammar(edtfstr))
+    return result
+
+
+@pytest.mark.parametrize("edtfstr", list(_dates()))
+def test_parity_date(edtfstr):
+    """Test dates parsed by the compiled parser match the grammar."""
+    _assert_parity(edtfstr)
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        f"{d}T{t}"
+        for d in ["1985-04-12", "2020-02-29", "2020-09", "2020"]
+        for t in times
+    ],
+)
+def test_parity_date_and_time(edtfstr):
+    """Test dates and times parsed by the compiled parser match the grammar."""
+    _assert_parity(edtfstr)
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        f"{lower}/{upper}"
+        for lower, upper in product(
+            ["2020", "2020-09", "2020-09-01", "2020-02-29", "2021-02-29", "2020-13"],
+            ["2021", "2020-11", "2020-11-15", "2020-04-31", "-0100", ""],
+        )
+    ],
+)
+def test_parity_interval(edtfstr):
+    """Test intervals parsed by the compiled parser match the grammar."""
+    _assert_parity(edtfstr)
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        f"{date}/{end}" if lower else f"{end}/{date}"
+        for date, end, lower in product(
+            ["2020", "2020-09", "2020-09-01", "2020-02-29", "-0100", "2021-02-29"],
+            ["..", ""],
+            [True, False],
+        )
+    ],
+)
+def test_parity_open_interval(edtfstr):
+    """Test intervals with an open or unknown end match the grammar."""
+    result = _assert_parity(edtfstr)
+    assert (result is None) is ("2021-02-29" in edtfstr)
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        "\uff12\uff10\uff12\uff10",  # Fullwidth digits
+        "\u0662\u0660\u0662\u0660-\u0660\u0669",  # Arabic-Indic digits
+        "2020-\u0660\u0669-30",
+        "2020/\uff12\uff10\uff12\uff11",
+        "1985-04-12T\uff12\uff13:20:30",
+        "1985-04-12T23:20:30+\u0660\u0664",
+    ],
+)
+def test_parity_non_ascii_digits(edtfstr):
+    """Test only ASCII digits are matched, like the grammar."""
+    assert _assert_parity(edtfstr) is None
+    assert _grammar(edtfstr) is None
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        "2020",
+        "-0100",
+        "2020-09",
+        "2020-02-29",
+        "1985-04-12T23:20:30",
+        "1985-04-12T24:00:00Z",
+        "1985-04-12T23:20:30+04:30",
+        "2020/2021",
+        "2020-09-02/2020-11",
+    ],
+)
+def test_level0_fast_path(edtfstr):
+    """Test level 0 expressions are handled by the compiled parser."""
+    assert _assert_parity(edtfstr) is not None
+
+
+@pytest.mark.parametrize(
+    "edtfstr",
+    [
+        # Level 1 and 2 expressions
+        "2020?",
+        "2020~",
+        "2020-21",
+        "2020~/..",
+        "../..",
+        "2020S2",
+        "Y170000002",
+        "[1667,1668]",
+        # Expressions the grammar accepts with whitespace
+        " 2020",
+        "2020 / 2021",
+        # Invalid values
+        "-0000",
+        "2020-13",
+        "2021-02-29",
+        "2020-13T23:20:30",
+        "2020/2021/2022",
+        "",
+    ],
+)
+def test_level0_fallback(edtfstr):
+    """Test non level 0 expressions are left to the grammar."""
+    assert _parse_level0(edtfstr) is None
+
+
+@pytest.mark.parametrize(
+    "timestr,expected",
+    [
+        ("00:00:00", (0, 0, 0, None)),
+        ("24:00:00", (24, 0, 0, None)),
+        ("23:20:30Z", (23, 20, 30, timezone.utc)),
+        ("23:20:30-04", (23, 20, 30, timezone(timedelta(hours=-4)))),
+        ("23:20:30+04:30", (23, 20, 30, timezone(timedelta(hours=4, minutes=30)))),
+        ("23:20:30-00:30", (23, 20, 30, timezone(timedelta(minutes=-30)))),
+    ],
+)
+def test_parse_level0_time(timestr, expected):
+    """Test parsing the times of dates and times."""
+    assert _parse_level0_time(timestr) == expected
+
+
+@pytest.mark.parametrize("timestr", times[9:] + [None])
+def test_parse_level0_time_invalid(timestr):
+    """Test invalid times."""
+    pytest.raises(EDTFValueError, _parse_level0_time, timestr)
+
+
+def test_parse_edtf_fallback():
+    """Test parse_edtf falls back to the grammar for non level 0 values."""
+    assert parse_edtf("2020?") == edtf_parse_edtf("2020?")
+    assert parse_edtf(" 2020") == edtf_parse_edtf("2020")
+
+
+def test_validate_many():
+    """Test the reasons why values are not valid level 0 expressions."""
+    values = [
+        "2020-02-29",
+        "2020-09/2021-02-28T10:00:00",
+        "2020-13",
+        "2020-04-31",
+        "2021-02-29",
+        "2020/2021-02-29",
+        "2020-09-01T25:00:00",
+        "2020?",
+        "-0000",
+        None,
+    ]
+    assert validate_many(values) == [
+        None,
+        "syntax",
+        "month",
+        "day",
+        "leap_day",
+        "leap_day",
+        "syntax",
+        "syntax",
+        "syntax",
+        "syntax",
+    ]
+    assert not is_valid_edtf_level0(None)
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Localized parsing tests."""
+
+import pytest
+
+from babel_edtf import EDTFValueError, format_edtf, parse_localized
+
+values = [
+    "2020",
+    "2020-09",
+    "2020-09-30",
+    "1999-12-31",
+    "2020/2021",
+    "2020-01/2020-09",
+    "2020-09/2021-11",
+    "2020-09-01/2020-09-30",
+    "2020-02-03/2021-05-06",
+]
+
+
+@pytest.mark.parametrize(
+    "locale", ["en", "da", "de", "es", "fr", "ja", "ru", "sv", "th"]
+)
+@pytest.mark.parametrize("format", ["full", "long", "medium", "short"])
+def test_round_trip(locale, format):
+    """Test parsing what format_edtf formats gives back the values."""
+    for value in values:
+        text = format_edtf(value, format, locale)
+        assert parse_localized(text, locale) == value
+
+
+@pytest.mark.parametrize(
+    "text,locale,expected",
+    [
+        ("sep 2020", "en", "2020-09"),
+        ("SEPTEMBER 2020", "en", "2020-09"),
+        ("  Sep 30 2020 ", "en", "2020-09-30"),
+        ("Jan-Sep 2020", "en", "2020-01/2020-09"),
+        ("Jan 2020 - Sep 2021", "en", "2020-01/2021-09"),
+        ("30. sep 2020", "da", "2020-09-30"),
+        ("30. September 2020", "da", "2020-09-30"),
+        ("onsdag den 30. september 2020", "da", "2020-09-30"),
+        ("30.09.20", "de", "2020-09-30"),
+        ("31.12.99", "de", "1999-12-31"),
+        ("2020年9月", "ja", "2020-09"),
+        # Patterns with narrow month names are left out.
+        ("2020", "mn", "2020"),
+    ],
+)
+def test_typed(text, locale, expected):
+    """Test parsing dates as typed by people."""
+    assert parse_localized(text, locale) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "Sept 2020",
+        "2020-09",
+        "Feb 30, 2020",
+        "Feb 29, 2021",
+        "13/1/2020",
+        "Monday, September 30, 2020",
+        "Sep 2020 - Foo 2021",
+    ],
+)
+def test_invalid(text):
+    """Test text which is not a valid date or interval of the locale."""
+    with pytest.raises(EDTFValueError):
+        parse_localized(text, "en")
@@ -3,9 +3,63 @@
 
 """Module tests."""
 
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 
 def test_version():
     """Test version import."""
     from babel_edtf import __version__
 
     assert __version__
+
+
+def test_lazy_imports():
+    """Test python-edtf and Babel are only imported when needed."""
+    code = (
+        "import sys, babel_edtf\n"
+        "babel_edtf.BOUND_LOWER, babel_edtf.EDTFValueError\n"
+        "print('edtf' in sys.modules, 'babel.dates' in sys.modules)\n"
+        "babel_edtf.format_edtf\n"
+        "print('edtf' in sys.modules, 'babel.dates' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout == "False False\nTrue True\n"
+
+
+def test_lazy_attributes():
+    """Test the lazily imported attributes."""
+    import babel_edtf
+    from babel_edtf.formatting import format_edtf
+
+    assert babel_edtf.format_edtf is format_edtf
+    assert "format_edtf" in dir(babel_edtf)
+    assert set(babel_edtf.__all__) <= set(dir(babel_edtf))
+    pytest.raises(AttributeError, getattr, babel_edtf, "missing")
+
+
+def test_star_import_without_numpy():
+    """Test importing all attributes works without the optional NumPy."""
+    code = (
+        "import sys\n"
+        "sys.modules['numpy'] = None\n"
+        "from babel_edtf import *\n"
+        "print(format_edtf('2020', locale='en'), 'edtf_to_datetime64' in dir())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout == "2020 False\n"
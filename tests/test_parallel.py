@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Parallel formatting tests."""
+
+import pytest
+
+from babel_edtf import EDTFValueError, format_edtf
+from babel_edtf.formatting import warm_up
+from babel_edtf.parallel import _format_chunk, format_edtf_parallel
+
+items = [
+    (value, locale, format)
+    for value in ["2020", "2020-09", "2020-09-30", "2020-09/2021-11"]
+    for locale in ["en", "da"]
+    for format in ["short", "long"]
+]
+
+
+def test_format_edtf_parallel():
+    """Test formatting with a pool of processes keeps the order of items."""
+    expected = [format_edtf(v, f, loc) for v, loc, f in items]
+    result = format_edtf_parallel(
+        iter(items), max_workers=2, chunksize=3, locales=["en"], formats=["long"]
+    )
+    assert list(result) == expected
+    assert list(format_edtf_parallel([], max_workers=1)) == []
+
+
+def test_format_edtf_parallel_invalid():
+    """Test errors in the workers are raised."""
+    result = format_edtf_parallel(
+        [("2020", "en", "short"), ("invalid", "en", "short")], max_workers=1
+    )
+    with pytest.raises(EDTFValueError):
+        list(result)
+
+
+def test_format_chunk():
+    """Test the work done by each worker process."""
+    warm_up(["en", "da"], ["short"])
+    assert _format_chunk([("2020-09", "en", "short"), ("2020-09", "da", "long")]) == [
+        "9/2020",
+        "september 2020",
+    ]
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Warm-up and pattern tables tests."""
+
+import json
+
+import pytest
+
+from babel_edtf import (
+    format_edtf,
+    formatting,
+    load_pattern_tables,
+    save_pattern_tables,
+    warm_up,
+)
+from babel_edtf.cli import main
+from babel_edtf.parallel import _init_worker, format_edtf_parallel
+
+values = ["2020", "2020-09", "2020-09-30", "2020/2021", "2020-09/2021-02"]
+formats = ["short", "long", "MMM y"]
+
+
+def _clear():
+    formatting._pattern_tables.clear()
+    formatting._get_date_pattern.cache_clear()
+    formatting._get_interval_skeleton.cache_clear()
+    formatting._get_interval_engine.cache_clear()
+
+
+@pytest.fixture()
+def clear_patterns():
+    """Start and end a test without resolved or loaded patterns."""
+    _clear()
+    yield
+    _clear()
+
+
+def test_warm_up(clear_patterns):
+    """Test all patterns of the locales and formats are resolved."""
+    warm_up(["en", "da"], ["short", "long"])
+    assert formatting._get_date_pattern.cache_info().currsize == 2 * 2 * 3
+    assert formatting._get_interval_skeleton.cache_info().currsize == 2 * 2 * 3
+
+
+def test_pattern_tables(clear_patterns, monkeypatch, tmp_path):
+    """Test loaded patterns are used instead of resolving them again."""
+    path = tmp_path / "patterns.json"
+    expected = [
+        format_edtf(v, f, loc)
+        for v in values
+        for f in formats
+        for loc in "en da".split()
+    ]
+    save_pattern_tables(path, ["en", "da"], formats)
+    _clear()
+
+    def match_skeleton(*args):
+        raise AssertionError("The pattern should have been loaded.")
+
+    monkeypatch.setattr(formatting, "match_skeleton", match_skeleton)
+    assert load_pattern_tables(path)
+    assert len(formatting._pattern_tables) == 2 * 3 * 3
+    assert formatting._get_date_pattern.cache_info().currsize == 2 * 3 * 3
+    assert expected == [
+        format_edtf(v, f, loc) for v in values for f in formats for loc in ["en", "da"]
+    ]
+
+
+def test_pattern_tables_other_babel(clear_patterns, tmp_path):
+    """Test patterns saved with another version of Babel are ignored."""
+    path = tmp_path / "patterns.json"
+    save_pattern_tables(path, ["en"])
+    tables = json.loads(path.read_text())
+    tables["babel"] = "0.1"
+    path.write_text(json.dumps(tables))
+    assert not load_pattern_tables(path)
+    assert formatting._pattern_tables == {}
+
+
+def test_pattern_tables_parallel(clear_patterns, tmp_path):
+    """Test workers load the pattern tables at startup."""
+    path = tmp_path / "patterns.json"
+    save_pattern_tables(path, ["da"], ["long"])
+    items = [(v, "da", "long") for v in values]
+    result = format_edtf_parallel(items, max_workers=1, pattern_tables=path)
+    assert list(result) == [format_edtf(v, "long", "da") for v in values]
+
+    _clear()
+    _init_worker(["en"], ["short"], path)
+    assert ("da", "long", "year") in formatting._pattern_tables
+    assert formatting._get_date_pattern.cache_info().currsize == 3 + 3
+
+
+def test_pattern_tables_cli(clear_patterns, tmp_path, capsys):
+    """Test the command line loads the pattern tables."""
+    path = tmp_path / "patterns.json"
+    save_pattern_tables(path, ["da"], ["long"])
+    _clear()
+    (tmp_path / "dates.txt").write_text("\n".join(values))
+    argv = ["-l", "da", "-f", "long", "--pattern-tables", str(path)]
+    assert main(argv + [str(tmp_path / "dates.txt")]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        format_edtf(v, "long", "da") for v in values
+    ]
+    assert formatting._pattern_tables
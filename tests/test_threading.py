@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 TU Wien.
+# SPDX-License-Identifier: MIT
+
+"""Thread safety tests."""
+
+import threading
+
+from edtf import parse_edtf as edtf_parse_edtf
+
+from babel_edtf import format_edtf, parse_edtf
+
+level0 = [
+    "2020",
+    "-0100",
+    "2020-09",
+    "2020-09-30",
+    "2020-02-29",
+    "1985-04-12T23:20:30",
+    "1985-04-12T23:20:30Z",
+    "1985-04-12T23:20:30-04",
+    "1985-04-12T23:20:30+04:30",
+    "2020/2021",
+    "2020-09/2021-11",
+    "2020-09-01/2020-11-15",
+    "2020-09-02/2020-11",
+]
+level1 = ["2020?", "2020-09~", "2021/..", "Y170000002"]
+
+
+def _hammer(func, values, expected, threads=8, rounds=50):
+    """Call func on all values concurrently from many threads."""
+    barrier = threading.Barrier(threads)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        for _ in range(rounds):
+            for value in values:
+                try:
+                    result = func(value)
+                    assert str(result) == expected[value], value
+                except Exception as e:
+                    errors.append(e)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert errors == []
+
+
+def test_parse_edtf_threads():
+    """Test concurrent parsing of all level 0 forms and level 1 fallbacks."""
+    values = level0 + level1
+    expected = {v: str(edtf_parse_edtf(v)) for v in values}
+    _hammer(parse_edtf, level0, expected)
+    _hammer(parse_edtf, values, expected, rounds=2)
+
+
+def test_format_edtf_threads():
+    """Test concurrent formatting."""
+    values = [v for v in level0 if "T" not in v and v[0] != "-"]
+    expected = {v: format_edtf(v, locale="da") for v in values}
+    _hammer(lambda v: format_edtf(v, locale="da"), values, expected)